@@ -0,0 +1,141 @@
+"""TelemetryLog yazma büyütmesi ve günlük disk kullanımı ölçümü.
+
+Bir günlük okuma (varsayılan 1 Hz, 2 sensör + 2 fan + 2 komut edilen hız)
+sentetik zaman damgalarıyla geçici bir dizine yazılır. Her toplu yazma
+boyutu için şunlar raporlanır:
+
+  - write sayısı ve write başına bayt
+  - mantıksal veri (kayıtlar + başlıklar) ve disk kullanımı
+  - sayfa büyütmesi: her write'ın dokunduğu 4 KB sayfaların toplamı / mantıksal veri
+  - mmap ile bir günün tek kanalını okuma süresi
+
+Karşılaştırma için aynı okumaların JSON satırı olarak boyutu da yazdırılır.
+
+Kullanım: python Uygulama/benchmarks/bench_telemetry_log.py [--rate HZ] [--days N]
+
+Örnek sonuç (1 Hz, 1 gün, 6 kanal, 16 baytlık kayıt):
+
+  flush_every  writes  bytes/write  disk/day  page ampl.
+            1   86400           16  1.32 MiB    256.0x
+           16    5400          256  1.32 MiB     16.0x
+      default     338         4090  1.32 MiB      1.0x  (bir sayfa, 256 kayıt)
+         3600     288         4800  1.32 MiB      1.9x  (flush_interval=300 s sınırı)
+
+  Aynı okumalar JSON satırı olarak ~10.7 MiB/gün tutar. 30 günlük saklama
+  yaklaşık 40 MiB'dır; bir günün tek kanalı mmap ile ~0.05 s'de okunur.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from Backend.TelemetryLog import TelemetryLog, TelemetryLogFile, list_logs
+
+PAGE_SIZE = 4096
+
+def make_values(i: int) -> dict:
+    return {
+        'sensor_0x01': 45 + (i // 30) % 40,
+        'sensor_0x06': 40 + (i // 45) % 30,
+        'fan_0x32': 1800 + (i * 7) % 3000,
+        'fan_0x33': 1700 + (i * 5) % 3200,
+        'duty_0x32': 30 + (i // 60) % 60,
+        'duty_0x33': None,
+    }
+
+class PageCounter:
+    """Dosya nesnesini sarar ve her write'ın dokunduğu sayfaları sayar"""
+
+    def __init__(self, file) -> None:
+        self._file = file
+        self.offset = 0
+        self.writes = 0
+        self.pages = 0
+
+    def write(self, data: bytes) -> int:
+        first = self.offset // PAGE_SIZE
+        last = (self.offset + len(data) - 1) // PAGE_SIZE
+        self.pages += last - first + 1
+        self.offset += len(data)
+        self.writes += 1
+        return self._file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+def run(flush_every, rate: float, days: float) -> dict:
+    directory = tempfile.mkdtemp(prefix='bench_telemetry_')
+    try:
+        log = TelemetryLog(directory, flush_every=flush_every)
+        counters = []
+        open_file = log._open
+
+        def counting_open(timestamp, channels):
+            open_file(timestamp, channels)
+            log._file = PageCounter(log._file)
+            counters.append(log._file)
+        log._open = counting_open
+
+        start = 1_700_000_000.0
+        samples = int(days * 86400 * rate)
+        t0 = time.perf_counter()
+        for i in range(samples):
+            log.append(start + i / rate, make_values(i))
+        log.close()
+        write_time = time.perf_counter() - t0
+
+        stats = log.getStats()
+        pages = sum(counter.pages for counter in counters)
+        writes = sum(counter.writes for counter in counters)
+
+        t0 = time.perf_counter()
+        points = 0
+        for path in list_logs(directory):
+            with TelemetryLogFile(path) as f:
+                points += len(f.series('sensor_0x01'))
+        read_time = time.perf_counter() - t0
+
+        return {
+            'flush_every': flush_every or 'default',
+            'writes': writes,
+            'bytes_per_write': stats['bytes_written'] / max(1, writes),
+            'disk_per_day': stats['disk_bytes'] / days,
+            'amplification': pages * PAGE_SIZE / max(1, stats['bytes_written']),
+            'record_bytes': stats['record_bytes'],
+            'files': stats['files'],
+            'write_s': write_time,
+            'read_s': read_time,
+            'points': points,
+        }
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def json_bytes_per_day(rate: float) -> float:
+    sample = 1000
+    size = sum(len(json.dumps({'t': 1_700_000_000.0 + i / rate, **make_values(i)})) + 1 for i in range(sample))
+    return size / sample * 86400 * rate
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rate', type=float, default=1.0, help='samples per second')
+    parser.add_argument('--days', type=float, default=1.0, help='simulated days of logging')
+    args = parser.parse_args()
+
+    mib = 1024 * 1024
+    print(f"{'flush_every':>11} {'writes':>8} {'bytes/write':>12} {'disk/day':>10} {'page ampl.':>11} "
+          f"{'write s':>8} {'mmap read s':>12}")
+    for flush_every in (1, 16, None, 3600):
+        r = run(flush_every, args.rate, args.days)
+        print(f"{r['flush_every']:>11} {r['writes']:>8} {r['bytes_per_write']:>12.0f} "
+              f"{r['disk_per_day'] / mib:>7.2f} MiB {r['amplification']:>10.2f}x "
+              f"{r['write_s']:>8.2f} {r['read_s']:>12.3f}")
+    print(f"record size: {r['record_bytes']} bytes, files: {r['files']}, points read: {r['points']}")
+    print(f"JSON lines for the same samples: {json_bytes_per_day(args.rate) / mib:.2f} MiB/day")
+
+if __name__ == '__main__':
+    main()
@@ -11,10 +11,41 @@ def is_admin():
     except:
         return False
 
+def _get_arg_value(name, default=None):
+    """--ad[=değer] argümanının değerini döndürür, argüman yoksa None"""
+    for arg in sys.argv[1:]:
+        if arg == name:
+            return default
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+def _create_fan_control_factory(simulate_profile, replay_path, record_path):
+    from src.Backend.FanControl import FanControl
+    if replay_path is not None:
+        # Kaydedilmiş AWCC trafiğini geri oynat (--replay-fast: gecikmeler olmadan)
+        from src.Backend.AwccTrace import ReplayBackend
+        realtime = "--replay-fast" not in sys.argv
+        return lambda: FanControl(awcc=ReplayBackend(replay_path, realtime=realtime), trace_path=record_path)
+
+    if simulate_profile is not None:
+        from src.Backend.SimulatedBackend import SimulatedThermalBackend, load_profile
+        load = load_profile(simulate_profile)
+        return lambda: FanControl(awcc=SimulatedThermalBackend(load=load), trace_path=record_path)
+
+    if record_path is not None:
+        return lambda: FanControl(trace_path=record_path)
+    return FanControl
+
 def main():
+    simulate_profile = _get_arg_value("--simulate", "square")
+    replay_path = _get_arg_value("--replay")
+    record_path = _get_arg_value("--record")
+    # Simülasyon ve geri oynatmada donanıma erişilmez
+    offline = simulate_profile is not None or replay_path is not None
     try:
         # Check admin rights first
-        if not is_admin():
+        if not offline and not is_admin():
             # Re-run the program with admin rights
             if getattr(sys, 'frozen', False):
                 # If it's an exe
@@ -24,16 +55,18 @@ def main():
                 ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, '"' + sys.argv[0] + '"', None, 1)
             return
 
-        from win32event import CreateMutex
-        from win32api import CloseHandle, GetLastError
-        from winerror import ERROR_ALREADY_EXISTS
         from src.GUI.AppGUI import FanControlGUI
         from src.GUI.LoaderDialog import LoaderDialog
         
-        mutex = CreateMutex(None, False, "FanControlCenter_Mutex")
-        if GetLastError() == ERROR_ALREADY_EXISTS:
-            CloseHandle(mutex)
-            return
+        if not offline:
+            from win32event import CreateMutex
+            from win32api import CloseHandle, GetLastError
+            from winerror import ERROR_ALREADY_EXISTS
+            
+            mutex = CreateMutex(None, False, "FanControlCenter_Mutex")
+            if GetLastError() == ERROR_ALREADY_EXISTS:
+                CloseHandle(mutex)
+                return
         
         app = QtWidgets.QApplication(sys.argv)
         
@@ -49,7 +82,7 @@ def main():
                 pass
         
         try:
-            window = FanControlGUI()
+            window = FanControlGUI(_create_fan_control_factory(simulate_profile, replay_path, record_path))
         except Exception as e:
             if loader:
                 loader.close()
@@ -1,6 +1,11 @@
 from typing import Optional, Tuple
 from enum import Enum
 from .Hardware_Detect import NoAWCCWMIClass, CannotInstAWCCWMI
+from .CallPacer import CallPacer
+from .WmiCallRunner import WmiCallRunner
+from .CircuitBreaker import CircuitBreaker
+from .ReadCache import ReadCache
+from .AwccTrace import TraceRecorder
 import time
 
 class AWCCWmiWrapper:
@@ -14,9 +19,53 @@ class AWCCWmiWrapper:
         Balanced = 0x97
         G_Mode = 0xAB
 
-    def __init__(self, awcc) -> None:
+    # Okuma türüne göre varsayılan önbellek süreleri (saniye)
+    DEFAULT_CACHE_TTLS = {'temp': 0.2, 'rpm': 0.2}
+
+    def __init__(self, awcc, pacer: Optional[CallPacer] = None,
+                 cached_ids: Optional[list[Tuple[int, Tuple[int, ...]]]] = None,
+                 runner: Optional[WmiCallRunner] = None,
+                 read_cache: Optional[ReadCache] = None,
+                 recorder: Optional[TraceRecorder] = None) -> None:
         self._awcc = awcc
-        self._detected_ids = self._detect_fan_sensor_ids()
+        
+        # Verilmişse tüm AWCC çağrıları izleme dosyasına kaydedilir
+        self._recorder = recorder
+        self._pacer = pacer if pacer is not None else CallPacer()
+        
+        # Runner verilmişse çağrılar süre sınırı ile ayrı thread'de çalışır
+        self._runner = runner
+        self._last_values = {}
+        self.last_call_stale = False
+        self.stale_reads = 0
+        
+        # Sürekli hata veren fan/sensör ID'leri için devre kesici
+        self._breaker = CircuitBreaker()
+        
+        # Aynı değerin kısa aralıklarla tekrar okunmasını önleyen önbellek
+        self._cache = read_cache if read_cache is not None else ReadCache(self.DEFAULT_CACHE_TTLS)
+        self._detection_source = 'probe'
+        
+        # Önbellekteki ID'ler her biri için tek okuma ile doğrulanır,
+        # uyuşmazlık varsa tam tarama yapılır
+        if cached_ids and self._validate_ids(cached_ids):
+            self._detected_ids = cached_ids
+            self._detection_source = 'cache'
+        else:
+            self._detected_ids = self._detect_fan_sensor_ids()
+
+    def _validate_ids(self, pairs: list[Tuple[int, Tuple[int, ...]]]) -> bool:
+        """Önbellekten gelen fan ve sensör ID'lerinin hâlâ okunabildiğini kontrol eder"""
+        try:
+            for fan_id, sensor_ids in pairs:
+                if self.GetFanRPM(fan_id) is None:
+                    return False
+                for sensor_id in sensor_ids:
+                    if self.GetSensorTemperature(sensor_id) is None:
+                        return False
+            return True
+        except Exception:
+            return False
 
     def _detect_fan_sensor_ids(self) -> list[Tuple[int, Tuple[int, ...]]]:
         """Fan ve sensör ID'lerini tespit eder"""
@@ -42,32 +91,30 @@ class AWCCWmiWrapper:
                         working_fans.append(fan_id)
             
             if not detected_pairs:
+                self._detection_source = 'default'
                 detected_pairs = [(0x32, (0x01,)), (0x33, (0x06,))]
             
             return detected_pairs
             
         except Exception:
+            self._detection_source = 'default'
             return [(0x32, (0x01,)), (0x33, (0x06,))]
 
     def GetFanIdsAndRelatedSensorsIds(self) -> list[Tuple[int, Tuple[int, ...]]]:
         """Tespit edilen fan ve sensör ID'lerini döndürür"""
         return self._detected_ids
 
+    def GetDetectionSource(self) -> str:
+        """ID'lerin nereden geldiğini döndürür: 'cache', 'probe' veya 'default'"""
+        return self._detection_source
+
     def GetFanRPM(self, fanId: int) -> Optional[int]:
         try:
             if not (fanId in range(self.FAN_ID_FIRST, self.FAN_ID_LAST + 1)):
                 return None
             
-            time.sleep(0.05)
             arg = ((fanId & 0xFF) << 8) | 0x05
-            val = self._call('Thermal_Information', arg)
-            
-            if val is not None and isinstance(val, int):
-                if val == -1 or val == 0xFFFFFFFF:
-                    return None
-                if 0 <= val <= 20000:
-                    return val
-            return None
+            return self._readChecked(('fan', fanId), arg, 20000)
             
         except Exception:
             return None
@@ -79,7 +126,21 @@ class AWCCWmiWrapper:
         if speed > 0xFF: speed = 0xFF
         try:
             arg = ((speed & 0xFF) << 16) | ((fanId & 0xFF) << 8) | 2
-            return self._call('Thermal_Control', arg) == 0
+            result = self._call('Thermal_Control', arg) == 0
+            # Fanın önbellekteki RPM değeri artık eski
+            self._cache.invalidate(('Thermal_Information', ((fanId & 0xFF) << 8) | 0x05))
+            return result
+        except:
+            return False
+
+    def SetThermalMode(self, mode: "AWCCWmiWrapper.ThermalMode") -> bool:
+        """Firmware termal modunu tek Thermal_Control çağrısı ile ayarla"""
+        try:
+            arg = ((mode.value & 0xFF) << 8) | 1
+            result = self._call('Thermal_Control', arg) == 0
+            # Fan hızları artık firmware'e göre değişecek
+            self._cache.invalidate()
+            return result
         except:
             return False
 
@@ -89,34 +150,101 @@ class AWCCWmiWrapper:
             if not (sensorId in range(self.SENSOR_ID_FIRST, self.SENSOR_ID_LAST + 1)):
                 return None
             
-            # WMI çağrısı öncesi kısa bekleme
-            time.sleep(0.05)
-            
-            # Sıcaklık bilgisini al
+            # Sıcaklık bilgisini al (makul sıcaklık aralığı 0-125)
             arg = ((sensorId & 0xFF) << 8) | 4
-            val = self._call('Thermal_Information', arg)
-            
-            # Değeri doğrula
-            if val is not None and isinstance(val, int):
-                if val == -1 or val == 0xFFFFFFFF:
-                    return None
-                if 0 <= val <= 125:  # Makul sıcaklık aralığı
-                    return val
-            return None
+            return self._readChecked(('sensor', sensorId), arg, 125)
             
         except Exception:
             return None
 
+    def _readChecked(self, key: Tuple[str, int], arg: int, max_value: int) -> Optional[int]:
+        """Thermal_Information okur, değeri doğrular ve ID'nin devre kesicisini günceller"""
+        if not self._breaker.allow(key):
+            # Bozuk ID: bekleme süresi dolana kadar okunmaz
+            self.last_call_stale = False
+            return None
+        
+        fresh = []
+        def load():
+            value = self._call('Thermal_Information', arg)
+            fresh.append(True)
+            # Zaman aşımından gelen bayat değerler önbelleğe alınmaz
+            return (value, self.last_call_stale), not self.last_call_stale
+        
+        kind = 'rpm' if key[0] == 'fan' else 'temp'
+        val, stale = self._cache.get(('Thermal_Information', arg), kind, load)
+        self.last_call_stale = stale
+        if not fresh:
+            # Önbellekten geldi, ID'nin sağlığı hakkında yeni bilgi yok
+            return self._validate(val, max_value)
+        
+        result = self._validate(val, max_value)
+        
+        # Zaman aşımından gelen bayat değerler ID'nin sağlığını etkilemez
+        if not self.last_call_stale:
+            if result is None:
+                self._breaker.failure(key)
+            else:
+                self._breaker.success(key)
+        return result
+
+    @staticmethod
+    def _validate(val, max_value: int) -> Optional[int]:
+        """Ham WMI değerini doğrular, geçersizse None döndürür"""
+        if val is not None and isinstance(val, int):
+            if val != -1 and val != 0xFFFFFFFF and 0 <= val <= max_value:
+                return val
+        return None
+
+    def getReadCache(self) -> ReadCache:
+        """Thermal_Information okuma önbelleğini döndürür"""
+        return self._cache
+
+    def isDegraded(self, kind: str, itemId: int) -> bool:
+        """Fan ('fan') veya sensör ('sensor') ID'si art arda hata verdiği için devre dışı mı"""
+        return self._breaker.isOpen((kind, itemId))
+
+    def getBreaker(self) -> CircuitBreaker:
+        """ID bazlı devre kesiciyi döndürür"""
+        return self._breaker
+
+    def getPacer(self) -> CallPacer:
+        """Çağrı aralıklarını yöneten pacer nesnesini döndürür"""
+        return self._pacer
+
+    def getRunner(self) -> Optional[WmiCallRunner]:
+        """Süre sınırlı çağrı çalıştırıcısını döndürür"""
+        return self._runner
+
     def _call(self, method: str, arg: int) -> Optional[int]:
+        if method not in ('Thermal_Information', 'Thermal_Control'):
+            return None
+        
+        # Firmware hata vermeye başladıysa pacer bekletir, aksi halde beklemez.
+        # Bağlantı yenilenirken çağrı zaten beklemeden döneceği için beklenmez.
+        if self._runner is None or not self._runner.reconnecting:
+            self._pacer.wait()
+        self.last_call_stale = False
+        timestamp = time.time()
+        start = time.perf_counter()
+        ok = False
+        timed_out = False
+        val = None
         try:
-            time.sleep(0.05)
-            
-            if method == 'Thermal_Information':
+            if self._runner is not None:
+                completed, val = self._runner.call(method, arg)
+                if not completed:
+                    timed_out = True
+                    if method != 'Thermal_Information':
+                        return None
+                    # Süre aşıldı: okuma için son geçerli değeri "bayat" olarak döndür
+                    self.last_call_stale = True
+                    self.stale_reads += 1
+                    return self._last_values.get(arg)
+            elif method == 'Thermal_Information':
                 val = self._awcc.Thermal_Information(arg)
-            elif method == 'Thermal_Control':
-                val = self._awcc.Thermal_Control(arg)
             else:
-                return None
+                val = self._awcc.Thermal_Control(arg)
             
             if isinstance(val, tuple):
                 val = val[0]
@@ -124,7 +252,18 @@ class AWCCWmiWrapper:
             if not isinstance(val, int):
                 return None
             
+            ok = True
+            if method == 'Thermal_Information':
+                self._last_values[arg] = val
             return val
             
         except Exception:
-            return None 
\ No newline at end of file
+            return None
+        finally:
+            latency = time.perf_counter() - start
+            # Süre aşımı ve yenileme sırasındaki dönüşler firmware hatası sayılmaz;
+            # sayılsaydı pacer en uzun beklemeye çıkıp her çağrıyı süre sınırının ötesine taşırdı
+            if not timed_out:
+                self._pacer.record(method, latency, ok)
+            if self._recorder is not None:
+                self._recorder.record(method, arg, val if ok else None, latency, timestamp, timed_out)
@@ -0,0 +1,85 @@
+from typing import Dict, Optional
+import time
+
+class AdaptivePoller:
+    """Sıcaklık değişim hızına göre okuma aralığını ayarlar.
+
+    Sıcaklıklar hızlı değişirken aralık yarıya iner, düz seyrederken yavaşça
+    uzar. Bir eğri noktasına yakınken aralık near_interval'ı aşmaz. Aralık her
+    zaman [min_interval, max_interval] içinde kalır.
+    """
+
+    # Bu hızın (°C/s) üstündeki değişimler "hızlı" sayılır
+    FAST_RATE = 0.5
+    # Düz seyirde her okumada aralığın çarpıldığı katsayı
+    BACKOFF = 1.25
+
+    def __init__(self, interval: float = 1.0, min_interval: float = 0.5, max_interval: float = 5.0) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.interval = self._clamp(interval)
+        self._last_temps: Dict[int, int] = {}
+        self._last_time: Optional[float] = None
+        self._started = time.monotonic()
+        self.polls = 0
+        self.rate = 0.0
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    @property
+    def near_interval(self) -> float:
+        return self._clamp(self.min_interval * 2)
+
+    def setLimits(self, min_interval: Optional[float] = None, max_interval: Optional[float] = None) -> None:
+        """En kısa ve en uzun okuma aralığını ayarla (saniye)"""
+        if min_interval is not None:
+            self.min_interval = min_interval
+        if max_interval is not None:
+            self.max_interval = max_interval
+        self.max_interval = max(self.min_interval, self.max_interval)
+        self.interval = self._clamp(self.interval)
+
+    def reset(self, interval: float) -> None:
+        """Aralığı verilen değerden yeniden başlat"""
+        self.interval = self._clamp(interval)
+
+    def update(self, snapshot, near_point: bool = False) -> float:
+        """Yeni okumaya göre bir sonraki okuma aralığını hesaplar"""
+        now = snapshot.timestamp
+        self.polls += 1
+
+        rate = 0.0
+        if self._last_time is not None and now > self._last_time:
+            dt = now - self._last_time
+            for sensorId, temp in snapshot.temperatures:
+                last = self._last_temps.get(sensorId)
+                if temp is not None and last is not None:
+                    rate = max(rate, abs(temp - last) / dt)
+        for sensorId, temp in snapshot.temperatures:
+            if temp is not None:
+                self._last_temps[sensorId] = temp
+        self._last_time = now
+        self.rate = rate
+
+        if rate >= self.FAST_RATE:
+            interval = self.interval / 2
+        elif rate == 0.0:
+            interval = self.interval * self.BACKOFF
+        else:
+            interval = self.interval
+        if near_point:
+            interval = min(interval, self.near_interval)
+        self.interval = self._clamp(interval)
+        return self.interval
+
+    def getStats(self) -> dict:
+        """Etkin okuma aralığı ve ortalama okuma hızını döndürür"""
+        minutes = max(time.monotonic() - self._started, 1.0) / 60
+        return {
+            'interval_ms': self.interval * 1000,
+            'min_interval_ms': self.min_interval * 1000,
+            'max_interval_ms': self.max_interval * 1000,
+            'rate_c_per_s': self.rate,
+            'polls_per_min': self.polls / minutes
+        }
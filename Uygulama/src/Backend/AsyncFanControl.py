@@ -0,0 +1,107 @@
+from typing import Callable, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+from .FanControl import FanControl
+from .ThermalSnapshot import ThermalSnapshot
+from .WmiCallRunner import com_initialize
+
+class AsyncFanControl:
+    """FanControl için asyncio arayüzü.
+
+    FanControl metodları tek bir thread'e sahip executor üzerinde sırayla
+    çalıştırılır ve FanControl bu thread içinde oluşturulur. AWCC COM nesnesi
+    ise WmiCallRunner'ın çağrı thread'inde yaşar; AWCC çağrıları süre sınırıyla
+    oraya iletilir. Executor thread'i yine de COM'u başlatır, çünkü sistem
+    bilgisi için yapılan WMI sorguları bu thread'de çalışır.
+    Her metod isteğe bağlı bir zaman aşımı alır. İptal edilen veya zaman aşımına
+    uğrayan çağrılar henüz başlamamışsa kuyruktan düşürülür.
+
+    Örnek (Linux'ta sahte AWCC nesnesi ile):
+        async with AsyncFanControl(lambda: FanControl(awcc=FakeAWCC())) as fans:
+            snapshot = await fans.read_snapshot(timeout=1.0)
+    """
+
+    def __init__(self, fan_control_factory: Callable[[], FanControl] = FanControl,
+                 default_timeout: Optional[float] = None) -> None:
+        self._factory = fan_control_factory
+        self._default_timeout = default_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._fanControl: Optional[FanControl] = None
+        self._pending: Set[asyncio.Future] = set()
+
+    @property
+    def fan_control(self) -> Optional[FanControl]:
+        """Executor thread'inde oluşturulan FanControl nesnesi"""
+        return self._fanControl
+
+    async def start(self, timeout: Optional[float] = None) -> None:
+        """Executor'ı başlat ve FanControl'ü onun thread'inde oluştur"""
+        if self._executor is not None:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='awcc',
+            initializer=com_initialize
+        )
+        try:
+            self._fanControl = await self._run(self._factory, timeout=timeout)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def close(self, timeout: Optional[float] = None) -> None:
+        """Bekleyen çağrıları iptal et, FanControl'ü ve executor'ı kapat"""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        fan_control, self._fanControl = self._fanControl, None
+        # Henüz başlamamış çağrılar kuyruktan düşürülür
+        for future in list(self._pending):
+            future.cancel()
+        if fan_control is not None:
+            # FanControl kendi thread'inde kapatılır: çağrı thread'i durur ve
+            # çağrı kaydının bekleyen kayıtları diske yazılır
+            if timeout is None:
+                timeout = self._default_timeout
+            loop = asyncio.get_running_loop()
+            try:
+                await asyncio.wait_for(loop.run_in_executor(executor, fan_control.close), timeout)
+            except asyncio.TimeoutError:
+                # Executor takılan bir çağrıyı bekliyor; kapatma thread güvenlidir
+                fan_control.close()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> 'AsyncFanControl':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _run(self, fn: Callable, *args, timeout: Optional[float] = None):
+        if self._executor is None:
+            raise RuntimeError("AsyncFanControl is not started")
+        if timeout is None:
+            timeout = self._default_timeout
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, partial(fn, *args))
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return await asyncio.wait_for(future, timeout)
+
+    async def read_snapshot(self, timeout: Optional[float] = None) -> ThermalSnapshot:
+        """Tüm fan ve sensör değerlerini tek seferde oku"""
+        return await self._run(lambda: self._fanControl.read_snapshot(), timeout=timeout)
+
+    async def set_fan_speed(self, fanId: int, speed: int, timeout: Optional[float] = None) -> bool:
+        """Fan hızını ayarla (0-100 arası)"""
+        return await self._run(lambda: self._fanControl.setFanSpeed(fanId, speed), timeout=timeout)
+
+    async def set_all_fan_speed(self, speed: int, timeout: Optional[float] = None) -> bool:
+        """Tüm fanların hızını ayarla"""
+        return await self._run(lambda: self._fanControl.setAllFanSpeed(speed), timeout=timeout)
+
+    async def apply_profile(self, profile_name: str, timeout: Optional[float] = None) -> bool:
+        """Belirtilen profili uygula"""
+        return await self._run(lambda: self._fanControl.apply_profile(profile_name), timeout=timeout)
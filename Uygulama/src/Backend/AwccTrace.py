@@ -0,0 +1,159 @@
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+import struct
+import threading
+import time
+
+INVALID = 0xFFFFFFFF
+
+# Dosya başlığı: sihirli değer + format sürümü
+_MAGIC = b'AWTR'
+_VERSION = 1
+_HEADER = struct.Struct('<4sH')
+
+# Kayıt: zaman damgası (f64), metod (u8), bayraklar (u8), argüman (u32), sonuç (u32), gecikme (f32)
+_RECORD = struct.Struct('<dBBIIf')
+
+_METHODS = ('Thermal_Information', 'Thermal_Control')
+
+_FLAG_RESULT = 0x01    # Sonuç alanı geçerli
+_FLAG_TIMEOUT = 0x02   # Çağrı süre sınırını aştı
+
+class TraceRecord(NamedTuple):
+    timestamp: float
+    method: str
+    arg: int
+    result: Optional[int]
+    latency: float
+    timed_out: bool
+
+class TraceRecorder:
+    """AWCC çağrılarını sabit boyutlu ikili kayıtlar olarak dosyaya yazar.
+
+    Kayıtlar bellekte toplanıp flush_every kayıtta bir toplu yazılır, böylece
+    kayıt açıkken bile her çağrı için disk erişimi olmaz.
+    """
+
+    def __init__(self, path: str, flush_every: int = 256) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._flush_every = flush_every
+        self._pending: List[bytes] = []
+        self._file: Optional[BinaryIO] = open(path, 'wb')
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION))
+        self.records = 0
+
+    def record(self, method: str, arg: int, result: Optional[int], latency: float,
+               timestamp: float, timed_out: bool = False) -> None:
+        """Tek bir çağrıyı kaydet"""
+        flags = 0
+        if isinstance(result, int):
+            flags |= _FLAG_RESULT
+            result &= 0xFFFFFFFF
+        else:
+            result = 0
+        if timed_out:
+            flags |= _FLAG_TIMEOUT
+        data = _RECORD.pack(timestamp, _METHODS.index(method), flags,
+                            arg & 0xFFFFFFFF, result, latency)
+        with self._lock:
+            if self._file is None:
+                return
+            self._pending.append(data)
+            self.records += 1
+            if len(self._pending) >= self._flush_every:
+                self._flush()
+
+    def _flush(self) -> None:
+        self._file.write(b''.join(self._pending))
+        self._file.flush()
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Bekleyen kayıtları diske yaz"""
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+
+    def close(self) -> None:
+        """Bekleyen kayıtları yaz ve dosyayı kapat"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush()
+            self._file.close()
+            self._file = None
+
+def read_trace(path: str) -> Iterator[TraceRecord]:
+    """Kayıt dosyasındaki çağrıları sırayla döndürür"""
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"{path} is not an AWCC trace file")
+        magic, version = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a supported AWCC trace file")
+
+        data = f.read()
+    # Yarım kalan son kayıt (ör. uygulama çökerse) yok sayılır
+    usable = len(data) - len(data) % _RECORD.size
+    for timestamp, method, flags, arg, result, latency in _RECORD.iter_unpack(data[:usable]):
+        yield TraceRecord(
+            timestamp=timestamp,
+            method=_METHODS[method],
+            arg=arg,
+            result=result if flags & _FLAG_RESULT else None,
+            latency=latency,
+            timed_out=bool(flags & _FLAG_TIMEOUT)
+        )
+
+class ReplayBackend:
+    """Kaydedilmiş AWCC çağrılarını donanım olmadan geri oynatan backend (ThermalBackend).
+
+    Her (metod, argüman) için kaydedilen sonuçlar sırayla döndürülür; uygulamanın
+    çağrı sırası kayıttakinden farklı olsa da her okuma kendi geçmişini görür.
+    realtime=True ise her çağrı kaydedilen gecikme kadar sürer (takılmalar dahil),
+    aksi halde sonuçlar beklemeden döner. loop=True ise biten geçmiş baştan tekrarlanır.
+    """
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = True) -> None:
+        self._lock = threading.Lock()
+        self._realtime = realtime
+        self._loop = loop
+        self._history: Dict[Tuple[str, int], List[TraceRecord]] = {}
+        self._position: Dict[Tuple[str, int], int] = {}
+        for record in read_trace(path):
+            self._history.setdefault((record.method, record.arg), []).append(record)
+        self.replayed = 0
+        self.missed = 0
+
+    def _next(self, method: str, arg: int) -> Optional[TraceRecord]:
+        key = (method, arg)
+        with self._lock:
+            history = self._history.get(key)
+            if not history:
+                self.missed += 1
+                return None
+            position = self._position.get(key, 0)
+            if position >= len(history):
+                if not self._loop:
+                    self.missed += 1
+                    return None
+                position = 0
+            self._position[key] = position + 1
+            self.replayed += 1
+            return history[position]
+
+    def _replay(self, method: str, arg: int, default: int):
+        record = self._next(method, arg)
+        if record is None:
+            return (default,)
+        if self._realtime:
+            time.sleep(record.latency)
+        return (record.result,) if record.result is not None else None
+
+    def Thermal_Information(self, arg: int):
+        return self._replay('Thermal_Information', arg, INVALID)
+
+    def Thermal_Control(self, arg: int):
+        # Kayıtta olmayan yazmalar başarılı sayılır
+        return self._replay('Thermal_Control', arg, 0)
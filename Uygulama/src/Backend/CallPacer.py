@@ -0,0 +1,106 @@
+from typing import Dict
+from collections import deque
+import threading
+import time
+
+class CallPacer:
+    """AWCC WMI çağrıları arasındaki beklemeyi ölçülen gecikme ve hata oranına göre ayarlar.
+
+    Firmware hata vermediği sürece çağrılar arasında bekleme yapılmaz (veya
+    yalnızca ayarlanan minimum bekleme uygulanır). Son çağrılardaki hata oranı
+    eşiği aştığında bekleme ikiye katlanarak artar, başarılı çağrılarla tekrar
+    minimuma iner.
+    """
+
+    def __init__(self, min_delay: float = 0.0, max_delay: float = 0.5,
+                 error_threshold: float = 0.2, window: int = 20) -> None:
+        self._lock = threading.Lock()
+        self._min_delay = max(0.0, min_delay)
+        self._max_delay = max(self._min_delay, max_delay)
+        self._error_threshold = error_threshold
+        self._window = window
+        self._delay = self._min_delay
+        self._last_call_end = 0.0
+        self._methods: Dict[str, dict] = {}
+
+    def _method_stats(self, method: str) -> dict:
+        stats = self._methods.get(method)
+        if stats is None:
+            stats = {
+                'calls': 0,
+                'errors': 0,
+                'avg_latency': 0.0,
+                'max_latency': 0.0,
+                'recent': deque(maxlen=self._window)
+            }
+            self._methods[method] = stats
+        return stats
+
+    def wait(self) -> None:
+        """Bir önceki çağrıdan bu yana geçen süre beklemeden kısaysa aradaki farkı bekle"""
+        with self._lock:
+            remaining = self._last_call_end + self._delay - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def record(self, method: str, latency: float, ok: bool) -> None:
+        """Tamamlanan bir çağrının süresini ve sonucunu kaydet, beklemeyi güncelle"""
+        with self._lock:
+            self._last_call_end = time.perf_counter()
+            stats = self._method_stats(method)
+            stats['calls'] += 1
+            if not ok:
+                stats['errors'] += 1
+            stats['recent'].append(ok)
+            # Üstel hareketli ortalama
+            if stats['calls'] == 1:
+                stats['avg_latency'] = latency
+            else:
+                stats['avg_latency'] += 0.2 * (latency - stats['avg_latency'])
+            stats['max_latency'] = max(stats['max_latency'], latency)
+
+            recent = stats['recent']
+            error_rate = recent.count(False) / len(recent)
+            if not ok and error_rate >= self._error_threshold:
+                # Firmware hata vermeye başladı, geri çekil
+                self._delay = min(self._max_delay, max(self._delay * 2, 0.01))
+            elif ok and self._delay > self._min_delay:
+                # Başarılı çağrılarla beklemeyi kademeli olarak azalt
+                self._delay = max(self._min_delay, self._delay * 0.5)
+                if self._delay < 0.001:
+                    self._delay = self._min_delay
+
+    def setMinDelay(self, seconds: float) -> None:
+        """Minimum bekleme süresini ayarla (saniye)"""
+        with self._lock:
+            self._min_delay = max(0.0, seconds)
+            self._max_delay = max(self._max_delay, self._min_delay)
+            self._delay = max(self._delay, self._min_delay)
+
+    @property
+    def min_delay(self) -> float:
+        return self._min_delay
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    def getStats(self) -> dict:
+        """Mevcut bekleme süresini ve metod bazlı gecikme/hata istatistiklerini döndürür"""
+        with self._lock:
+            methods = {}
+            for method, stats in self._methods.items():
+                recent = stats['recent']
+                methods[method] = {
+                    'calls': stats['calls'],
+                    'errors': stats['errors'],
+                    'error_rate': (recent.count(False) / len(recent)) if recent else 0.0,
+                    'avg_latency_ms': stats['avg_latency'] * 1000,
+                    'max_latency_ms': stats['max_latency'] * 1000
+                }
+            return {
+                'delay_ms': self._delay * 1000,
+                'min_delay_ms': self._min_delay * 1000,
+                'max_delay_ms': self._max_delay * 1000,
+                'methods': methods
+            }
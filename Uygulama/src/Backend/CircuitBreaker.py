@@ -0,0 +1,55 @@
+from typing import Dict, Hashable, List
+import threading
+import time
+
+class CircuitBreaker:
+    """Fan/sensör ID'si başına ardışık hataları izleyen devre kesici.
+
+    Bir ID art arda threshold kez okunamazsa devre açılır ve ID okunmaz;
+    yalnızca üstel artan bekleme süreleri sonunda tek bir deneme okumasına
+    izin verilir. Başarılı bir okuma devreyi tekrar kapatır.
+    """
+
+    def __init__(self, threshold: int = 3, base_backoff: float = 2.0, max_backoff: float = 60.0) -> None:
+        self._lock = threading.Lock()
+        self._threshold = threshold
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._failures: Dict[Hashable, int] = {}
+        self._next_probe: Dict[Hashable, float] = {}
+        self.skipped = 0
+
+    def allow(self, key: Hashable) -> bool:
+        """ID'nin şimdi okunup okunmayacağını döndürür"""
+        with self._lock:
+            next_probe = self._next_probe.get(key)
+            if next_probe is None or time.monotonic() >= next_probe:
+                return True
+            self.skipped += 1
+            return False
+
+    def success(self, key: Hashable) -> None:
+        """Başarılı okuma: devreyi kapat"""
+        with self._lock:
+            self._failures.pop(key, None)
+            self._next_probe.pop(key, None)
+
+    def failure(self, key: Hashable) -> None:
+        """Başarısız okuma: eşik aşıldıysa devreyi aç ve sonraki denemeyi planla"""
+        with self._lock:
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if failures >= self._threshold:
+                backoff = min(self._max_backoff,
+                              self._base_backoff * (2 ** (failures - self._threshold)))
+                self._next_probe[key] = time.monotonic() + backoff
+
+    def isOpen(self, key: Hashable) -> bool:
+        """ID şu anda bozuk (devre açık) olarak işaretli mi"""
+        with self._lock:
+            return key in self._next_probe
+
+    def openKeys(self) -> List[Hashable]:
+        """Devresi açık olan tüm ID'leri döndürür"""
+        with self._lock:
+            return list(self._next_probe.keys())
@@ -0,0 +1,132 @@
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+import heapq
+import itertools
+import threading
+import time
+
+# Öncelikler: küçük değer önce çalışır
+PRIORITY_USER_WRITE = 0
+PRIORITY_PROFILE = 1
+PRIORITY_READ = 2
+PRIORITY_DISCOVERY = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_USER_WRITE: 'user_write',
+    PRIORITY_PROFILE: 'profile',
+    PRIORITY_READ: 'read',
+    PRIORITY_DISCOVERY: 'discovery',
+}
+
+class ScheduledCommand:
+    __slots__ = ('priority', 'name', 'func', 'args', 'key', 'enqueued', 'cancelled')
+
+    def __init__(self, priority: int, name: str, func: Callable, args: tuple,
+                 key: Optional[Hashable]) -> None:
+        self.priority = priority
+        self.name = name
+        self.func = func
+        self.args = args
+        self.key = key
+        self.enqueued = time.monotonic()
+        self.cancelled = False
+
+class _PriorityStats:
+    __slots__ = ('executed', 'superseded', 'total_wait', 'max_wait')
+
+    def __init__(self) -> None:
+        self.executed = 0
+        self.superseded = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+class CommandScheduler:
+    """AWCC erişimini tek sıraya sokan öncelikli komut kuyruğu.
+
+    Komutlar önceliğe, aynı öncelikte geliş sırasına göre alınır; böylece bir
+    fan yazması bekleyen okumaların arkasında kalmaz. Anahtarlı bir komut
+    eklendiğinde aynı anahtarla bekleyen eski komut düşürülür (ör. henüz
+    çalışmamış eski bir okuma).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._heap: List[Tuple[int, int, ScheduledCommand]] = []
+        self._pending: Dict[Hashable, ScheduledCommand] = {}
+        self._sequence = itertools.count()
+        self._depth: Dict[int, int] = {priority: 0 for priority in PRIORITY_NAMES}
+        self._stats: Dict[int, _PriorityStats] = {priority: _PriorityStats() for priority in PRIORITY_NAMES}
+        self._wakeups = 0
+
+    def submit(self, priority: int, name: str, func: Callable, *args,
+               key: Optional[Hashable] = None) -> None:
+        """Komutu kuyruğa ekle; aynı anahtarla bekleyen komut varsa onun yerine geçer"""
+        command = ScheduledCommand(priority, name, func, args, key)
+        with self._lock:
+            if key is not None:
+                old = self._pending.pop(key, None)
+                if old is not None:
+                    old.cancelled = True
+                    self._depth[old.priority] -= 1
+                    self._stats[old.priority].superseded += 1
+                self._pending[key] = command
+            heapq.heappush(self._heap, (priority, next(self._sequence), command))
+            self._depth[priority] += 1
+            self._available.notify()
+
+    def isPending(self, key: Hashable) -> bool:
+        """Anahtarlı bir komut kuyrukta bekliyor mu"""
+        with self._lock:
+            return key in self._pending
+
+    def wakeup(self) -> None:
+        """get() içinde bekleyen thread'i komut olmadan uyandır"""
+        with self._lock:
+            self._wakeups += 1
+            self._available.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ScheduledCommand]:
+        """En öncelikli komutu döndür; süre dolarsa veya uyandırılırsa None"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while True:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                if self._heap:
+                    command = heapq.heappop(self._heap)[2]
+                    if command.key is not None:
+                        self._pending.pop(command.key, None)
+                    self._depth[command.priority] -= 1
+                    stats = self._stats[command.priority]
+                    wait = time.monotonic() - command.enqueued
+                    stats.executed += 1
+                    stats.total_wait += wait
+                    stats.max_wait = max(stats.max_wait, wait)
+                    return command
+                if self._wakeups:
+                    self._wakeups = 0
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._available.wait(remaining)
+
+    def depth(self) -> int:
+        """Kuyruktaki toplam komut sayısı"""
+        with self._lock:
+            return sum(self._depth.values())
+
+    def getStats(self) -> dict:
+        """Öncelik başına kuyruk derinliği, bekleme süreleri ve düşürülen komutlar"""
+        with self._lock:
+            stats = {}
+            for priority, name in PRIORITY_NAMES.items():
+                entry = self._stats[priority]
+                stats[name] = {
+                    'depth': self._depth[priority],
+                    'executed': entry.executed,
+                    'superseded': entry.superseded,
+                    'avg_wait_ms': entry.total_wait / entry.executed * 1000 if entry.executed else 0.0,
+                    'max_wait_ms': entry.max_wait * 1000
+                }
+            return stats
@@ -0,0 +1,113 @@
+from typing import Dict, Optional
+import time
+
+class _FanState:
+    __slots__ = ('output', 'reference_temp', 'changed_at', 'raw_output', 'raw_changes', 'writes')
+
+    def __init__(self) -> None:
+        self.output: Optional[int] = None
+        self.reference_temp: Optional[int] = None
+        self.changed_at = 0.0
+        self.raw_output: Optional[int] = None
+        self.raw_changes = 0
+        self.writes = 0
+
+class ControlDeadband:
+    """Kontrolcü çıkışı ile setFanSpeed arasındaki histerezis/ölü bant katmanı.
+
+    Hız artışları hemen uygulanır (soğutma gecikmez). Düşüş için sıcaklığın son
+    değişikliği tetikleyen değerden en az temp_hysteresis kadar düşmüş olması ve
+    son değişiklikten bu yana min_hold saniye geçmiş olması gerekir. min_step'ten
+    küçük hız farkları her iki yönde de yok sayılır (0 ve 100'e ulaşmak hariç).
+    """
+
+    def __init__(self, temp_hysteresis: float = 3.0, min_step: int = 5, min_hold: float = 5.0) -> None:
+        self.temp_hysteresis = temp_hysteresis
+        self.min_step = min_step
+        self.min_hold = min_hold
+        self._overrides: Dict[int, Dict[str, float]] = {}
+        self._states: Dict[int, _FanState] = {}
+        self._started = time.monotonic()
+
+    def configure(self, fanId: Optional[int] = None, temp_hysteresis: Optional[float] = None,
+                  min_step: Optional[int] = None, min_hold: Optional[float] = None) -> None:
+        """Varsayılan (fanId=None) veya tek bir fan için ayarları değiştir"""
+        values = {'temp_hysteresis': temp_hysteresis, 'min_step': min_step, 'min_hold': min_hold}
+        values = {name: value for name, value in values.items() if value is not None}
+        if fanId is None:
+            for name, value in values.items():
+                setattr(self, name, value)
+        else:
+            self._overrides.setdefault(fanId, {}).update(values)
+
+    def _setting(self, fanId: int, name: str):
+        return self._overrides.get(fanId, {}).get(name, getattr(self, name))
+
+    def reset(self, fanId: Optional[int] = None) -> None:
+        """Fanın (veya tüm fanların) durumunu unut; sonraki çıkış hemen uygulanır"""
+        if fanId is None:
+            for state in self._states.values():
+                state.output = None
+        elif fanId in self._states:
+            self._states[fanId].output = None
+
+    def filter(self, fanId: int, temp: int, duty: int, now: Optional[float] = None) -> int:
+        """Kontrolcünün istediği hızı süz, fana yazılacak hızı döndür"""
+        if now is None:
+            now = time.monotonic()
+        state = self._states.get(fanId)
+        if state is None:
+            state = self._states[fanId] = _FanState()
+
+        if duty != state.raw_output:
+            state.raw_changes += 1
+            state.raw_output = duty
+
+        if state.output is None or self._accept(fanId, state, temp, duty, now):
+            if duty != state.output:
+                state.writes += 1
+                state.changed_at = now
+            state.output = duty
+            state.reference_temp = temp
+        return state.output
+
+    def _accept(self, fanId: int, state: _FanState, temp: int, duty: int, now: float) -> bool:
+        delta = duty - state.output
+        if delta == 0:
+            return False
+        # Küçük adımlar yok sayılır, ama uç değerlere her zaman ulaşılır
+        if abs(delta) < self._setting(fanId, 'min_step') and duty not in (0, 100):
+            return False
+        if delta > 0:
+            return True
+        if temp > state.reference_temp - self._setting(fanId, 'temp_hysteresis'):
+            return False
+        return now - state.changed_at >= self._setting(fanId, 'min_hold')
+
+    def quantize(self, fanId: int, value: int) -> int:
+        """Değeri min_step katlarına yuvarla; ölü bant dışında eklenen terimlerin
+        küçük dalgalanmalarının her turda yazmaya dönüşmesini önler"""
+        step = self._setting(fanId, 'min_step')
+        if step <= 1:
+            return value
+        return int(round(value / step)) * step
+
+    def getStats(self) -> dict:
+        """Fan başına dakikadaki hız değişikliği sayısı: süzgeçten önce ve sonra"""
+        minutes = max(time.monotonic() - self._started, 1.0) / 60
+        fans = {
+            fanId: {
+                'raw_changes_per_min': state.raw_changes / minutes,
+                'writes_per_min': state.writes / minutes,
+                'output': state.output
+            }
+            for fanId, state in self._states.items()
+        }
+        return {
+            'temp_hysteresis': self.temp_hysteresis,
+            'min_step': self.min_step,
+            'min_hold_ms': self.min_hold * 1000,
+            'raw_changes_per_min': sum(fan['raw_changes_per_min'] for fan in fans.values()),
+            'writes_per_min': sum(fan['writes_per_min'] for fan in fans.values()),
+            'fans': fans
+        }
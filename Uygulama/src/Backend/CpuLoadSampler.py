@@ -0,0 +1,41 @@
+from typing import List, Optional
+
+try:
+    import psutil
+except ImportError:  # psutil yoksa yük ileri beslemesi devre dışı kalır
+    psutil = None
+
+class CpuLoadSampler:
+    """Kontrol döngüsünün her turunda CPU kullanımını tek psutil çağrısı ile okur.
+
+    cpu_percent(percpu=True) beklemeden, önceki çağrıdan bu yana geçen süre için
+    çekirdek başına kullanımı döndürür; genel kullanım bunların ortalamasıdır.
+    """
+
+    def __init__(self) -> None:
+        self.overall = 0.0
+        self.busiest = 0.0
+        self.per_core: List[float] = []
+        if psutil is not None:
+            # İlk çağrı referans noktasıdır, anlamlı değer döndürmez
+            psutil.cpu_percent(percpu=True)
+
+    @staticmethod
+    def available() -> bool:
+        return psutil is not None
+
+    def sample(self) -> Optional[float]:
+        """Kontrol için yük değeri (0-1); psutil yoksa None.
+
+        Tek çekirdeği dolduran yükler de paketi ısıttığından, en yoğun çekirdeğin
+        yarısı genel ortalamadan büyükse o kullanılır.
+        """
+        if psutil is None:
+            return None
+        per_core = psutil.cpu_percent(percpu=True)
+        if not per_core:
+            return None
+        self.per_core = per_core
+        self.overall = sum(per_core) / len(per_core)
+        self.busiest = max(per_core)
+        return max(self.overall, self.busiest / 2) / 100
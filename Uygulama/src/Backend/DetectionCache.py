@@ -0,0 +1,55 @@
+from typing import Optional, Tuple
+import json
+import os
+
+class DetectionCache:
+    """Tespit edilen fan/sensör ID'lerini sistem modeli ve BIOS sürümüne göre diskte saklar"""
+
+    def __init__(self):
+        self.cache_file = self._get_cache_path()
+
+    def _get_cache_path(self) -> str:
+        """Önbellek dosyasının yolunu döndürür"""
+        app_data = os.getenv('APPDATA', os.path.expanduser('~'))
+        cache_dir = os.path.join(app_data, 'FanControl')
+
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        return os.path.join(cache_dir, 'detected_ids.json')
+
+    def _read(self) -> dict:
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Failed to load detection cache: {e}")
+        return {}
+
+    def load(self, system_key: str) -> Optional[list[Tuple[int, Tuple[int, ...]]]]:
+        """Sistem anahtarı için kaydedilmiş fan/sensör çiftlerini döndürür"""
+        if not system_key:
+            return None
+        entry = self._read().get(system_key)
+        if not entry:
+            return None
+        try:
+            return [(int(fan_id), tuple(int(s) for s in sensor_ids))
+                    for fan_id, sensor_ids in entry['pairs']]
+        except Exception:
+            return None
+
+    def save(self, system_key: str, pairs: list[Tuple[int, Tuple[int, ...]]]) -> None:
+        """Fan/sensör çiftlerini sistem anahtarı ile kaydet"""
+        if not system_key:
+            return
+        try:
+            data = self._read()
+            data[system_key] = {
+                'pairs': [[fan_id, list(sensor_ids)] for fan_id, sensor_ids in pairs]
+            }
+            with open(self.cache_file, 'w') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            print(f"Failed to save detection cache: {e}")
@@ -1,12 +1,27 @@
-from typing import Optional, List
-import wmi
+from typing import Optional, List, Tuple, Dict
 import ctypes
 import sys
 import time
 import logging
 from .AWCCWmiWrapper import AWCCWmiWrapper
+from .CallPacer import CallPacer
+from .WmiCallRunner import WmiCallRunner
+from .ThermalSnapshot import ThermalSnapshot
 from .Hardware_Detect import DetectHardware
-from .FanProfile import ProfileManager, FanProfile
+from .DetectionCache import DetectionCache
+from .SensorDiscovery import SensorDiscovery
+from .FanProfile import ProfileManager, FanProfile, PROFILE_KIND_CURVE, PROFILE_KIND_PID, PROFILE_KIND_FIRMWARE
+from .FanCurve import CurveController
+from .PidController import PidController
+from .TrendEstimator import TrendEstimator
+from .CpuLoadSampler import CpuLoadSampler
+from .ControlDeadband import ControlDeadband
+from .AwccTrace import TraceRecorder
+
+try:
+    import wmi
+except ImportError:  # wmi yalnızca Windows'ta bulunur
+    wmi = None
 
 def is_admin():
     """Check if the program has admin privileges"""
@@ -16,42 +31,44 @@ def is_admin():
         return False
 
 class FanControl:
-    def __init__(self) -> None:
+    # Aynı hız bu süre boyunca tekrar yazılmaz, sonra firmware sıfırlamalarına karşı yeniden gönderilir
+    REASSERT_INTERVAL = 60.0
+
+    def __init__(self, min_call_delay_ms: int = 0, awcc=None, call_timeout: float = 2.0,
+                 trace_path: Optional[str] = None) -> None:
         logging.info("Initializing FanControl...")
+        init_start = time.perf_counter()
         
-        # Check admin privileges
-        if not is_admin():
-            logging.error("Admin privileges required")
-            raise Exception("Administrator privileges required. Please run as administrator.")
-
-        # WMI bağlantısını birkaç kez deneme
-        max_retries = 5  # Retry sayısını artırdık
-        retry_delay = 2  # Bekleme süresini artırdık
+        # Verilmişse tüm AWCC çağrıları sonradan geri oynatılmak üzere kaydedilir
+        self._recorder = TraceRecorder(trace_path) if trace_path else None
+        if self._recorder is not None:
+            logging.info(f"Recording AWCC calls to {trace_path}")
         
-        last_error = None
-        for attempt in range(max_retries):
-            try:
-                logging.info(f"Attempting WMI connection (attempt {attempt + 1}/{max_retries})")
-                wmi_service = wmi.WMI(namespace="root\\WMI")
-                logging.info("WMI service connected")
-                
-                logging.info("Getting AWCC WMI class")
-                awccClass = wmi_service.AWCCWmiMethodFunction
-                logging.info("AWCC WMI class obtained")
-                
-                logging.info("Creating AWCC wrapper")
-                self._awcc = AWCCWmiWrapper(awccClass()[0])
-                logging.info("AWCC wrapper created successfully")
-                break
-                
-            except Exception as ex:
-                last_error = str(ex)
-                logging.warning(f"WMI connection attempt {attempt + 1} failed: {ex}")
-                time.sleep(retry_delay)
+        # WMI çağrı aralıklarını firmware hatalarına göre ayarlayan pacer
+        self._pacer = CallPacer(min_delay=min_call_delay_ms / 1000)
+        self._callTimeout = call_timeout
+        
+        detection_cache = None
+        system_key = None
+        cached_ids = None
+        if awcc is not None:
+            # Dışarıdan verilen AWCC nesnesi (ör. Linux'ta test için sahte nesne)
+            runner = WmiCallRunner(lambda: awcc, self._callTimeout)
+            detect_start = time.perf_counter()
+            self._awcc = AWCCWmiWrapper(awcc, self._pacer, runner=runner, recorder=self._recorder)
+            self.detection_time = time.perf_counter() - detect_start
         else:
-            error_msg = f"WMI Connection failed after {max_retries} attempts. Last error: {last_error}"
-            logging.error(error_msg)
-            raise Exception("Failed to connect to AWCC WMI service. Please ensure Alienware Command Center is running and try again.")
+            # Check admin privileges
+            if not is_admin():
+                logging.error("Admin privileges required")
+                raise Exception("Administrator privileges required. Please run as administrator.")
+            
+            # Önceki tespit sonucunu sistem modeli/BIOS anahtarı ile önbellekten al
+            detection_cache = DetectionCache()
+            system_key = self._getSystemKey()
+            cached_ids = detection_cache.load(system_key)
+            
+            self._connectWmi(cached_ids)
 
         try:
             # Tespit edilen fan ve sensör ID'lerini al
@@ -59,6 +76,12 @@ class FanControl:
             detected_pairs = self._awcc.GetFanIdsAndRelatedSensorsIds()
             logging.info(f"Detected pairs: {detected_pairs}")
             
+            detection_source = self._awcc.GetDetectionSource()
+            if detection_source == 'probe' and detection_cache is not None:
+                detection_cache.save(system_key, detected_pairs)
+            elif detection_source == 'default' and cached_ids:
+                logging.warning("Cached fan/sensor IDs did not validate and probing failed")
+            
             if len(detected_pairs) >= 2:
                 # CPU ve GPU fan/sensör ID'lerini ayarla
                 cpu_fan_id, cpu_sensor_ids = detected_pairs[0]
@@ -81,8 +104,103 @@ class FanControl:
         self._fanIds = self._getFanIds()
         if not self._fanIds:
             raise Exception("Fan IDs could not be retrieved")
+        self._sensorIds = list(dict.fromkeys([self.CPU_SENSOR_ID, self.GPU_SENSOR_ID]))
+        
+        # Son başarıyla gönderilen fan hızları: fanId -> (hız, zaman)
+        self._commanded: Dict[int, Tuple[int, float]] = {}
+        self.writes_issued = 0
+        self.writes_skipped = 0
+        
+        # Arka plan taramasıyla bulunan ek fan ve sensörler
+        self._discovery: Optional[SensorDiscovery] = None
+        self.discovered_fans: List[int] = []
+        self.discovered_sensors: List[int] = []
+        
+        # Son okunan değerler: farklı aralıklarla okunan türler için
+        self._lastTemps: Dict[int, Optional[int]] = {}
+        self._lastRpms: Dict[int, Optional[int]] = {}
+        
+        # Fanları sıcaklığa göre süren kontrolcüler: fanId -> kontrolcü
+        self._controllers: Dict[int, object] = {}
+        # Kontrolcü çıkışındaki küçük/sık değişimleri süzen histerezis katmanı
+        self._deadband = ControlDeadband()
+        # Sensör başına sıcaklık eğilimi; eğri fanları bu kadar saniye sonrasına göre öne alır
+        self._trends: Dict[int, TrendEstimator] = {}
+        self.predict_horizon = 4.0
+        # CPU yükü ileri beslemesi: tam yükte CPU fanına eklenen hız (%), psutil yoksa etkisiz
+        self._loadSampler = CpuLoadSampler()
+        self.load_feedforward = 20
+        self.cpu_load: Optional[float] = None
+        
+        # Uygulamanın en son ayarladığı firmware termal modu. None: bu oturumda hiç
+        # ayarlanmadı; firmware önceki oturumdan kalan bir modda olabilir
+        self.thermal_mode: Optional[AWCCWmiWrapper.ThermalMode] = None
 
         self.profile_manager = ProfileManager()
+        
+        self.startup_time = time.perf_counter() - init_start
+        logging.info(
+            f"FanControl ready in {self.startup_time * 1000:.0f} ms "
+            f"(ID detection: {self.detection_time * 1000:.0f} ms, source: {detection_source})"
+        )
+
+    def _connectWmi(self, cached_ids) -> None:
+        """AWCC WMI sınıfına bağlanır ve wrapper'ı oluşturur"""
+        if wmi is None:
+            raise Exception("The wmi package is not available on this system.")
+        
+        # WMI bağlantısını birkaç kez deneme
+        max_retries = 5  # Retry sayısını artırdık
+        retry_delay = 2  # Bekleme süresini artırdık
+        
+        last_error = None
+        for attempt in range(max_retries):
+            try:
+                logging.info(f"Attempting WMI connection (attempt {attempt + 1}/{max_retries})")
+                # AWCC nesnesi, süre sınırlı çağrıları yürüten thread içinde oluşturulur
+                runner = WmiCallRunner(self._createAwccObject, self._callTimeout)
+                
+                logging.info("Creating AWCC wrapper")
+                detect_start = time.perf_counter()
+                self._awcc = AWCCWmiWrapper(None, self._pacer, cached_ids, runner, recorder=self._recorder)
+                self.detection_time = time.perf_counter() - detect_start
+                logging.info("AWCC wrapper created successfully")
+                break
+                
+            except Exception as ex:
+                last_error = str(ex)
+                logging.warning(f"WMI connection attempt {attempt + 1} failed: {ex}")
+                time.sleep(retry_delay)
+        else:
+            error_msg = f"WMI Connection failed after {max_retries} attempts. Last error: {last_error}"
+            logging.error(error_msg)
+            raise Exception("Failed to connect to AWCC WMI service. Please ensure Alienware Command Center is running and try again.")
+
+    def _createAwccObject(self):
+        """AWCC WMI nesnesini oluşturur (çağrı thread'i içinde çalışır)"""
+        wmi_service = wmi.WMI(namespace="root\\WMI")
+        logging.info("WMI service connected")
+        
+        logging.info("Getting AWCC WMI class")
+        awccClass = wmi_service.AWCCWmiMethodFunction
+        logging.info("AWCC WMI class obtained")
+        return awccClass()[0]
+
+    def _getSystemKey(self) -> Optional[str]:
+        """Tespit önbelleği için sistem anahtarını döndürür"""
+        try:
+            return DetectHardware().getSystemKey()
+        except Exception as e:
+            logging.warning(f"System key could not be read: {e}")
+            return None
+
+    def getStartupInfo(self) -> dict:
+        """Başlangıç süresini ve ID tespitinin kaynağını döndürür"""
+        return {
+            'startup_ms': self.startup_time * 1000,
+            'detection_ms': self.detection_time * 1000,
+            'detection_source': self._awcc.GetDetectionSource()
+        }
 
     def _getFanIds(self) -> List[int]:
         """Sistemdeki fan ID'lerini döndürür"""
@@ -111,14 +229,273 @@ class FanControl:
         except:
             return None
 
-    def setFanSpeed(self, fanId: int, speed: int) -> bool:
-        """Fan hızını ayarlar (0-100 arası)"""
+    def read_snapshot(self, read_temps: bool = True, read_rpms: bool = True) -> ThermalSnapshot:
+        """Sensör sıcaklıklarını ve fan RPM'lerini okur.
+
+        Okunmayan tür (ör. yalnızca sıcaklıkların okunduğu bir turda RPM'ler) için
+        son okunan değerler kullanılır; böylece türler farklı aralıklarla okunabilir.
+        """
+        latencies = []
+        stale = []
+        degraded = []
+        start = time.perf_counter()
+        
+        # Thermal_Information çağrıları arka arkaya yapılır, araya başka iş girmez.
+        # Kontrol için daha önemli olan sıcaklıklar önce okunur.
+        for sensorId in self._sensorIds + self.discovered_sensors:
+            field = f"sensor_0x{sensorId:02X}"
+            if read_temps:
+                t0 = time.perf_counter()
+                try:
+                    temp = self._awcc.GetSensorTemperature(sensorId)
+                except:
+                    temp = None
+                latencies.append((field, time.perf_counter() - t0))
+                self._lastTemps[sensorId] = temp
+                if self._awcc.last_call_stale:
+                    stale.append(field)
+            if self._awcc.isDegraded('sensor', sensorId):
+                degraded.append(field)
+        
+        for fanId in self._fanIds + self.discovered_fans:
+            field = f"fan_0x{fanId:02X}"
+            if read_rpms:
+                t0 = time.perf_counter()
+                try:
+                    rpm = self._awcc.GetFanRPM(fanId)
+                except:
+                    rpm = None
+                latencies.append((field, time.perf_counter() - t0))
+                self._lastRpms[fanId] = rpm if rpm and rpm > 0 else None
+                if self._awcc.last_call_stale:
+                    stale.append(field)
+            if self._awcc.isDegraded('fan', fanId):
+                degraded.append(field)
+        
+        return ThermalSnapshot(
+            timestamp=time.time(),
+            fan_rpms=tuple((fanId, self._lastRpms.get(fanId)) for fanId in self._fanIds + self.discovered_fans),
+            temperatures=tuple((sensorId, self._lastTemps.get(sensorId))
+                               for sensorId in self._sensorIds + self.discovered_sensors),
+            latencies=tuple(latencies),
+            total_latency=time.perf_counter() - start,
+            stale=tuple(stale),
+            degraded=tuple(degraded)
+        )
+
+    def startDiscovery(self, min_probe_interval: float = 0.25) -> bool:
+        """Tüm fan/sensör ID aralığının arka planda taranmasını başlatır"""
+        if self._discovery is None:
+            self._discovery = SensorDiscovery(
+                self._awcc, self._fanIds, self._sensorIds, min_probe_interval
+            )
+            logging.info(f"Background discovery started ({self._discovery.remaining} IDs)")
+        return True
+
+    def discoveryPending(self) -> bool:
+        """Taranacak ID kalıp kalmadığını döndürür"""
+        return self._discovery is not None and not self._discovery.done
+
+    def discoveryNextDueIn(self) -> float:
+        """Bir sonraki tarama adımına kalan süreyi döndürür"""
+        return self._discovery.nextDueIn() if self._discovery is not None else 0.0
+
+    def discoverStep(self) -> Optional[Tuple[str, int]]:
+        """Tek bir ID'yi tarar, yeni doğrulanan fan/sensör varsa (tür, id) döndürür"""
+        if not self.discoveryPending() or not self._discovery.isDue():
+            return None
+        found = self._discovery.step()
+        if found:
+            kind, item_id = found
+            if kind == 'fan':
+                self.discovered_fans.append(item_id)
+            else:
+                self.discovered_sensors.append(item_id)
+            logging.info(f"Discovered {kind} 0x{item_id:02X}")
+        if self._discovery.done:
+            logging.info(f"Background discovery finished after {self._discovery.probes} probes")
+        return found
+
+    def setFanSpeed(self, fanId: int, speed: int, force: bool = False) -> bool:
+        """Fan hızını ayarlar (0-100 arası), fan zaten bu hızdaysa yazmayı atlar"""
         try:
             if speed < 0: speed = 0
             if speed > 100: speed = 100
-            return self._awcc.SetFanSpeed(fanId, speed)
+            
+            commanded = self._commanded.get(fanId)
+            if (not force and commanded is not None and commanded[0] == speed
+                    and time.monotonic() - commanded[1] < self.REASSERT_INTERVAL):
+                self.writes_skipped += 1
+                return True
+            
+            # Firmware modundan elle fan kontrolüne dönmek için önce Custom moda geç.
+            # Mod bilinmiyorsa (yeniden başlatma sonrası) da geçilir.
+            if self.thermal_mode != AWCCWmiWrapper.ThermalMode.Custom:
+                if not self._awcc.SetThermalMode(AWCCWmiWrapper.ThermalMode.Custom):
+                    return False
+                self.thermal_mode = AWCCWmiWrapper.ThermalMode.Custom
+            
+            self.writes_issued += 1
+            success = self._awcc.SetFanSpeed(fanId, speed)
+            if success:
+                self._commanded[fanId] = (speed, time.monotonic())
+            else:
+                self._commanded.pop(fanId, None)
+            return success
         except:
+            self._commanded.pop(fanId, None)
+            return False
+
+    def reassertCommanded(self) -> None:
+        """Süresi dolan fan hızlarını firmware sıfırlamalarına karşı yeniden gönderir"""
+        now = time.monotonic()
+        for fanId, (speed, commanded_at) in list(self._commanded.items()):
+            if now - commanded_at >= self.REASSERT_INTERVAL:
+                self.setFanSpeed(fanId, speed, force=True)
+
+    def getCommandedStats(self) -> dict:
+        """Gönderilen ve gereksiz olduğu için atlanan fan hızı yazma sayılarını döndürür"""
+        return {
+            'issued': self.writes_issued,
+            'skipped': self.writes_skipped,
+            'commanded': {fanId: speed for fanId, (speed, _) in self._commanded.items()}
+        }
+
+    def setThermalMode(self, mode: AWCCWmiWrapper.ThermalMode) -> bool:
+        """Firmware termal modunu ayarlar; Custom dışındaki modlarda fanları firmware yönetir"""
+        if mode != AWCCWmiWrapper.ThermalMode.Custom:
+            # Yazılım kontrolü ve periyodik hız yenileme durur
+            self.releaseControl()
+            self._commanded.clear()
+        if not self._awcc.SetThermalMode(mode):
+            logging.warning(f"Failed to set thermal mode {mode.name}")
             return False
+        self.thermal_mode = mode
+        return True
+
+    def isFirmwareControlled(self) -> bool:
+        """Fanlar şu anda firmware termal modu tarafından mı yönetiliyor"""
+        return self.thermal_mode is not None and self.thermal_mode != AWCCWmiWrapper.ThermalMode.Custom
+
+    def hasActiveControl(self) -> bool:
+        """Her okumada sıcaklığa göre sürülen bir fan var mı"""
+        return bool(self._controllers)
+
+    def isNearControlPoint(self, snapshot: ThermalSnapshot, margin: float = 2.0) -> bool:
+        """Kontrol edilen bir sensör eğri noktasına veya PID hedefine margin °C'den yakın mı"""
+        for controller in self._controllers.values():
+            temp = snapshot.temp(controller.sensor_id)
+            if temp is None:
+                continue
+            curve = getattr(controller, 'curve', None)
+            if curve is not None and any(abs(temp - point) <= margin for point, _ in curve.points):
+                return True
+            target = getattr(controller, 'target', None)
+            if target is not None and abs(temp - target) <= margin:
+                return True
+        return False
+
+    def setController(self, fanId: int, controller) -> None:
+        """Fanı her okumada bir kontrolcüye göre sür (None: kontrolü bırak)"""
+        if controller is None:
+            self._controllers.pop(fanId, None)
+        else:
+            self._controllers[fanId] = controller
+        self._deadband.reset(fanId)
+
+    def releaseControl(self, fanId: Optional[int] = None) -> None:
+        """Bir fanın (veya tüm fanların) sıcaklık kontrolünü bırak"""
+        if fanId is None:
+            self._controllers.clear()
+        else:
+            self._controllers.pop(fanId, None)
+        self._deadband.reset(fanId)
+
+    def getControllers(self) -> Dict[int, object]:
+        """Etkin kontrolcüleri döndürür: fanId -> kontrolcü"""
+        return dict(self._controllers)
+
+    def getControlState(self) -> Dict[int, dict]:
+        """İç durumunu veren kontrolcülerin (ör. PID hata/integral/çıkış) durumları: fanId -> durum"""
+        return {
+            fanId: controller.getState()
+            for fanId, controller in self._controllers.items()
+            if hasattr(controller, 'getState')
+        }
+
+    def runControl(self, snapshot: ThermalSnapshot, now: Optional[float] = None) -> bool:
+        """Okunan sıcaklıklara göre kontrol edilen fanların hızını günceller"""
+        if now is None:
+            now = time.monotonic()
+        
+        # Her sensörün eğilimi okuma başına bir kez güncellenir
+        projections = {}
+        for sensorId in {controller.sensor_id for controller in self._controllers.values()}:
+            trend = self._trends.get(sensorId)
+            if trend is None:
+                trend = self._trends[sensorId] = TrendEstimator()
+            trend.add(now, snapshot.temp(sensorId))
+            if self.predict_horizon > 0:
+                projections[sensorId] = trend.project(self.predict_horizon)
+        
+        # Yük artışı sensöre yansımadan CPU fanını hızlandırmak için tur başına tek psutil çağrısı
+        feedforward = {}
+        if self.load_feedforward > 0 and self.CPU_FAN_ID in self._controllers:
+            self.cpu_load = self._loadSampler.sample()
+            if self.cpu_load is not None:
+                feedforward[self.CPU_FAN_ID] = int(round(self.load_feedforward * self.cpu_load))
+        
+        return self._driveControllers(snapshot.temp, now, projections, feedforward)
+
+    def _driveControllers(self, read_temp, now: Optional[float] = None,
+                          projections: Optional[Dict[int, Optional[float]]] = None,
+                          feedforward: Optional[Dict[int, int]] = None) -> bool:
+        # setFanSpeed, hız değişmediyse yazmayı atlar
+        success = True
+        if now is None:
+            now = time.monotonic()
+        for fanId, controller in list(self._controllers.items()):
+            temp = read_temp(controller.sensor_id)
+            projected = projections.get(controller.sensor_id) if projections else None
+            duty = controller.update(temp, now, projected)
+            if duty is None:
+                continue
+            # Tahmine göre hızlanan fanlarda ölü bant referansı tahmini sıcaklıktır
+            reference = getattr(controller, 'effective_temp', None)
+            duty = self._deadband.filter(fanId, temp if reference is None else reference, duty, now)
+            # Yük terimi ölü banttan sonra eklenir; yük düşünce sıcaklık
+            # histerezisini beklemeden geri çekilir
+            if feedforward and feedforward.get(fanId):
+                duty = min(100, duty + self._deadband.quantize(fanId, feedforward[fanId]))
+            if not self.setFanSpeed(fanId, duty):
+                success = False
+        return success
+
+    def setControlDeadband(self, temp_hysteresis: Optional[float] = None, min_step: Optional[int] = None,
+                           min_hold_ms: Optional[int] = None, fanId: Optional[int] = None) -> None:
+        """Sıcaklık histerezisi (°C), en küçük hız adımı (%) ve en kısa bekleme süresini (ms) ayarlar"""
+        self._deadband.configure(
+            fanId,
+            temp_hysteresis=max(0.0, temp_hysteresis) if temp_hysteresis is not None else None,
+            min_step=max(0, min_step) if min_step is not None else None,
+            min_hold=max(0, min_hold_ms) / 1000 if min_hold_ms is not None else None
+        )
+
+    def setPredictHorizon(self, seconds: float) -> None:
+        """Eğri fanlarının sıcaklık eğilimine göre ne kadar önceden hızlanacağını ayarlar (0 = kapalı)"""
+        self.predict_horizon = max(0.0, seconds)
+
+    def setLoadFeedforward(self, gain: int) -> None:
+        """Tam CPU yükünde kontrol edilen CPU fanına eklenecek hızı (%) ayarlar (0 = kapalı)"""
+        self.load_feedforward = min(100, max(0, gain))
+
+    def getTrends(self) -> Dict[int, float]:
+        """Sensör başına tahmini sıcaklık eğimi (°C/s)"""
+        return {sensorId: trend.slope() for sensorId, trend in self._trends.items()}
+
+    def getControlStats(self) -> dict:
+        """Histerezis öncesi ve sonrası dakikadaki hız değişikliği sayılarını döndürür"""
+        return self._deadband.getStats()
 
     def setAllFanSpeed(self, speed: int) -> bool:
         """Tüm fanların hızını ayarlar"""
@@ -135,22 +512,99 @@ class FanControl:
         except:
             return None
 
+    def setMinCallDelay(self, delay_ms: int) -> None:
+        """WMI çağrıları arasındaki minimum bekleme süresini ayarlar (ms)"""
+        self._pacer.setMinDelay(max(0, delay_ms) / 1000)
+
+    def setCallTimeout(self, timeout_ms: int) -> None:
+        """Her AWCC çağrısı için süre sınırını ayarlar (ms)"""
+        self._callTimeout = max(100, timeout_ms) / 1000
+        runner = self._awcc.getRunner()
+        if runner is not None:
+            runner.timeout = self._callTimeout
+
+    def getWatchdogStats(self) -> dict:
+        """Zaman aşımı, bağlantı yenileme ve bayat okuma sayılarını döndürür"""
+        runner = self._awcc.getRunner()
+        return {
+            'timeout_ms': self._callTimeout * 1000,
+            'timeouts': runner.timeouts if runner else 0,
+            'reconnects': runner.reconnects if runner else 0,
+            'stale_reads': self._awcc.stale_reads
+        }
+
+    def getDegradedIds(self) -> List[Tuple[str, int]]:
+        """Art arda hata verdiği için okunmayan fan/sensör ID'lerini döndürür"""
+        return self._awcc.getBreaker().openKeys()
+
+    def setReadCacheTtl(self, kind: str, ttl_ms: int) -> None:
+        """Okuma türü ('temp' veya 'rpm') için önbellek süresini ayarlar (ms)"""
+        self._awcc.getReadCache().setTtl(kind, max(0, ttl_ms) / 1000)
+
+    def getReadCacheStats(self) -> dict:
+        """Okuma önbelleğinin isabet oranını ve sürelerini döndürür"""
+        return self._awcc.getReadCache().getStats()
+
+    def getCallPacingStats(self) -> dict:
+        """Seçilen bekleme süresini ve WMI çağrı gecikme/hata istatistiklerini döndürür"""
+        return self._pacer.getStats()
+
     def apply_profile(self, profile_name: str) -> bool:
         """Belirtilen profili uygular"""
         profile = self.profile_manager.get_profile(profile_name)
         if not profile:
             return False
-            
-        cpu_success = self.setFanSpeed(self.CPU_FAN_ID, profile.cpu_speed)
-        gpu_success = self.setFanSpeed(self.GPU_FAN_ID, profile.gpu_speed)
         
-        return cpu_success and gpu_success 
+        self.releaseControl()
+        if profile.kind == PROFILE_KIND_FIRMWARE:
+            # Firmware modu tek Thermal_Control çağrısıdır, fan hızı yazılmaz
+            try:
+                mode = AWCCWmiWrapper.ThermalMode[profile.thermal_mode]
+            except KeyError:
+                logging.error(f"Unknown thermal mode in profile {profile_name}: {profile.thermal_mode}")
+                return False
+            return self.setThermalMode(mode)
+        
+        if profile.kind == PROFILE_KIND_CURVE:
+            # Eğrisi olan fanlar her okumada sıcaklığa göre sürülür
+            if profile.cpu_curve is not None:
+                self.setController(self.CPU_FAN_ID, CurveController(self.CPU_SENSOR_ID, profile.cpu_curve))
+            if profile.gpu_curve is not None:
+                self.setController(self.GPU_FAN_ID, CurveController(self.GPU_SENSOR_ID, profile.gpu_curve))
+        elif profile.kind == PROFILE_KIND_PID:
+            # Hedef sıcaklığı olan fanlar PID ile sürülür, başlangıç çıkışı profilin sabit hızı
+            if profile.cpu_target is not None:
+                self.setController(self.CPU_FAN_ID, PidController(
+                    self.CPU_SENSOR_ID, profile.cpu_target, profile.pid_gains, profile.cpu_speed))
+            if profile.gpu_target is not None:
+                self.setController(self.GPU_FAN_ID, PidController(
+                    self.GPU_SENSOR_ID, profile.gpu_target, profile.pid_gains, profile.gpu_speed))
+        
+        cpu_success = (self.CPU_FAN_ID in self._controllers
+                       or self.setFanSpeed(self.CPU_FAN_ID, profile.cpu_speed))
+        gpu_success = (self.GPU_FAN_ID in self._controllers
+                       or self.setFanSpeed(self.GPU_FAN_ID, profile.gpu_speed))
+        
+        # Bir sonraki okumayı beklemeden eğriyi güncel sıcaklıkla uygula
+        control_success = self._driveControllers(self.getSensorTemp)
+        
+        return cpu_success and gpu_success and control_success
+
+    def close(self) -> None:
+        """AWCC çağrı thread'ini durdur ve çağrı kaydını diske yazıp kapat"""
+        runner = self._awcc.getRunner() if hasattr(self, '_awcc') else None
+        if runner is not None:
+            runner.close()
+        recorder, self._recorder = getattr(self, '_recorder', None), None
+        if recorder is not None:
+            recorder.close()
 
     def __del__(self):
         """Destructor - kaynakları temizle"""
         try:
             # WMI bağlantısını kapat
+            self.close()
             if hasattr(self, '_awcc'):
                 del self._awcc
         except:
-            pass 
\ No newline at end of file
+            pass
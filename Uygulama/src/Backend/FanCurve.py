@@ -0,0 +1,97 @@
+from typing import List, Optional, Sequence, Tuple
+
+# GetSensorTemperature'ın kabul ettiği sıcaklık aralığı (°C)
+TEMP_MIN = 0
+TEMP_MAX = 125
+
+class FanCurve:
+    """Sıcaklıktan fan hızına parçalı doğrusal eğri.
+
+    Noktalar bir kez 0-125 °C için tam sayı tablosuna derlenir; her okumada
+    değerlendirme tek bir tablo erişimidir.
+    """
+
+    def __init__(self, points: Sequence[Tuple[int, int]]) -> None:
+        if not points:
+            raise ValueError("A fan curve needs at least one point")
+        cleaned = []
+        for temp, duty in points:
+            if not TEMP_MIN <= temp <= TEMP_MAX:
+                raise ValueError(f"Curve temperature out of range: {temp}")
+            if not 0 <= duty <= 100:
+                raise ValueError(f"Curve duty out of range: {duty}")
+            cleaned.append((int(temp), int(duty)))
+        cleaned.sort()
+        for (t0, _), (t1, _) in zip(cleaned, cleaned[1:]):
+            if t0 == t1:
+                raise ValueError(f"Duplicate curve temperature: {t0}")
+
+        self.points: List[Tuple[int, int]] = cleaned
+        self._table = bytes(self._compile(cleaned))
+
+    @staticmethod
+    def _compile(points: List[Tuple[int, int]]) -> List[int]:
+        table = []
+        for temp in range(TEMP_MIN, TEMP_MAX + 1):
+            if temp <= points[0][0]:
+                duty = points[0][1]
+            elif temp >= points[-1][0]:
+                duty = points[-1][1]
+            else:
+                for (t0, d0), (t1, d1) in zip(points, points[1:]):
+                    if t0 <= temp <= t1:
+                        duty = d0 + (d1 - d0) * (temp - t0) / (t1 - t0)
+                        break
+            table.append(int(round(duty)))
+        return table
+
+    def evaluate(self, temp: int) -> int:
+        """Sıcaklık için fan hızını (%) döndürür"""
+        if temp <= TEMP_MIN:
+            return self._table[0]
+        if temp >= TEMP_MAX:
+            return self._table[-1]
+        return self._table[int(temp)]
+
+    def to_list(self) -> List[List[int]]:
+        """profiles.json için [[sıcaklık, hız], ...] listesi"""
+        return [[temp, duty] for temp, duty in self.points]
+
+    @classmethod
+    def from_list(cls, data: Sequence[Sequence[int]]) -> "FanCurve":
+        return cls([(temp, duty) for temp, duty in data])
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FanCurve) and self.points == other.points
+
+    def __repr__(self) -> str:
+        return f"FanCurve({self.points})"
+
+class CurveController:
+    """Bir fanı bağlı sensörün sıcaklığına göre eğriden süren kontrolcü"""
+
+    def __init__(self, sensor_id: int, curve: FanCurve) -> None:
+        self.sensor_id = sensor_id
+        self.curve = curve
+        # Son çıkışı belirleyen sıcaklık (gerçek ya da tahmini)
+        self.effective_temp: Optional[int] = None
+
+    def update(self, temp: Optional[int], now: float, projected: Optional[float] = None) -> Optional[int]:
+        """Yeni sıcaklık için hedef fan hızını döndürür, okunamadıysa None.
+
+        projected verilmişse (eğilimden tahmin edilen yakın gelecek sıcaklığı)
+        fan, sıcaklık eğri noktasına ulaşmadan önceden hızlandırılır. Bu durumda
+        effective_temp tahmini sıcaklıktır; ölü bant bunu referans alır, böylece
+        beklenen artış gelmezse fan tahmin düşer düşmez yavaşlayabilir.
+        """
+        if temp is None:
+            return None
+        duty = self.curve.evaluate(temp)
+        self.effective_temp = temp
+        if projected is not None:
+            projected_temp = int(round(projected))
+            projected_duty = self.curve.evaluate(projected_temp)
+            if projected_duty > duty:
+                duty = projected_duty
+                self.effective_temp = projected_temp
+        return duty
@@ -1,13 +1,32 @@
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
 import json
 import os
+from .FanCurve import FanCurve
+from .PidController import PidGains
+
+# Profil türleri: sabit hız, sıcaklığa göre eğri, hedef sıcaklık (PID) veya firmware termal modu
+PROFILE_KIND_STATIC = "static"
+PROFILE_KIND_CURVE = "curve"
+PROFILE_KIND_PID = "pid"
+PROFILE_KIND_FIRMWARE = "firmware"
+
+# Kodda tanımlı, profiles.json'a yazılmayan profiller
+FIXED_PROFILES = ["Silent", "Balanced", "Performance", "G Mode", "Auto"]
 
 @dataclass
 class FanProfile:
     name: str
     cpu_speed: int
     gpu_speed: int
+    kind: str = PROFILE_KIND_STATIC
+    cpu_curve: Optional[FanCurve] = None
+    gpu_curve: Optional[FanCurve] = None
+    cpu_target: Optional[float] = None
+    gpu_target: Optional[float] = None
+    pid_gains: Optional[PidGains] = None
+    # Firmware profilleri için AWCCWmiWrapper.ThermalMode adı ('Balanced', 'G_Mode')
+    thermal_mode: Optional[str] = None
 
 class ProfileManager:
     def __init__(self):
@@ -15,21 +34,22 @@ class ProfileManager:
             "Silent": FanProfile("Silent", 30, 30),
             "Balanced": FanProfile("Balanced", 50, 50),
             "Performance": FanProfile("Performance", 70, 70),
-            "G Mode": FanProfile("G Mode", 100, 100),
+            "G Mode": FanProfile("G Mode", 100, 100, kind=PROFILE_KIND_FIRMWARE, thermal_mode="G_Mode"),
+            "Auto": FanProfile("Auto", 50, 50, kind=PROFILE_KIND_FIRMWARE, thermal_mode="Balanced"),
             "Custom": FanProfile("Custom", 50, 50)
         }
         self.current_profile: str = "Balanced"
         self._load_profiles()
 
     def add_profile(self, profile: FanProfile) -> bool:
-        if profile.name in ["Silent", "Balanced", "Performance", "G Mode", "Custom"]:
+        if profile.name in FIXED_PROFILES + ["Custom"]:
             return False
         self.profiles[profile.name] = profile
         self._save_profiles()
         return True
 
     def remove_profile(self, name: str) -> bool:
-        if name in ["Silent", "Balanced", "Performance", "G Mode", "Custom"]:
+        if name in FIXED_PROFILES + ["Custom"]:
             return False
         if name in self.profiles:
             del self.profiles[name]
@@ -56,9 +76,9 @@ class ProfileManager:
 
     def _save_profiles(self) -> None:
         custom_profiles = {
-            name: {"cpu_speed": p.cpu_speed, "gpu_speed": p.gpu_speed}
+            name: self._profile_to_dict(p)
             for name, p in self.profiles.items()
-            if name not in ["Silent", "Balanced", "Performance"]
+            if name not in FIXED_PROFILES
         }
         
         try:
@@ -73,11 +93,64 @@ class ProfileManager:
                 with open(self._get_profile_path(), 'r', encoding='utf-8') as f:
                     custom_profiles = json.load(f)
                     
+                renamed = False
                 for name, data in custom_profiles.items():
-                    self.profiles[name] = FanProfile(
-                        name=name,
-                        cpu_speed=data["cpu_speed"],
-                        gpu_speed=data["gpu_speed"]
-                    )
+                    # Eski sürümler G Mode'u sabit hız olarak kaydediyordu
+                    if name == "G Mode":
+                        continue
+                    try:
+                        profile = self._profile_from_dict(name, data)
+                    except Exception as e:
+                        # Bozuk bir profil diğerlerinin yüklenmesini engellemez
+                        print(f"Profil yükleme hatası ({name}): {e}")
+                        continue
+                    # Sonradan sabit profil olan bir adla (ör. Auto) kaydedilmiş
+                    # kullanıcı profili silinmesin diye yeniden adlandırılır
+                    if name in FIXED_PROFILES:
+                        profile.name = name = self._unique_name(name)
+                        renamed = True
+                    self.profiles[name] = profile
+                if renamed:
+                    self._save_profiles()
         except Exception as e:
-            print(f"Profil yükleme hatası: {e}") 
\ No newline at end of file
+            print(f"Profil yükleme hatası: {e}")
+
+    def _unique_name(self, name: str) -> str:
+        index = 2
+        while f"{name} ({index})" in self.profiles or f"{name} ({index})" in FIXED_PROFILES:
+            index += 1
+        return f"{name} ({index})"
+
+    @staticmethod
+    def _profile_to_dict(profile: FanProfile) -> dict:
+        data = {"cpu_speed": profile.cpu_speed, "gpu_speed": profile.gpu_speed}
+        if profile.kind != PROFILE_KIND_STATIC:
+            data["kind"] = profile.kind
+        if profile.cpu_curve is not None:
+            data["cpu_curve"] = profile.cpu_curve.to_list()
+        if profile.gpu_curve is not None:
+            data["gpu_curve"] = profile.gpu_curve.to_list()
+        if profile.cpu_target is not None:
+            data["cpu_target"] = profile.cpu_target
+        if profile.gpu_target is not None:
+            data["gpu_target"] = profile.gpu_target
+        if profile.pid_gains is not None:
+            data["pid_gains"] = profile.pid_gains.to_dict()
+        if profile.thermal_mode is not None:
+            data["thermal_mode"] = profile.thermal_mode
+        return data
+
+    @staticmethod
+    def _profile_from_dict(name: str, data: dict) -> FanProfile:
+        return FanProfile(
+            name=name,
+            cpu_speed=data["cpu_speed"],
+            gpu_speed=data["gpu_speed"],
+            kind=data.get("kind", PROFILE_KIND_STATIC),
+            cpu_curve=FanCurve.from_list(data["cpu_curve"]) if "cpu_curve" in data else None,
+            gpu_curve=FanCurve.from_list(data["gpu_curve"]) if "gpu_curve" in data else None,
+            cpu_target=data.get("cpu_target"),
+            gpu_target=data.get("gpu_target"),
+            pid_gains=PidGains.from_dict(data["pid_gains"]) if "pid_gains" in data else None,
+            thermal_mode=data.get("thermal_mode")
+        )
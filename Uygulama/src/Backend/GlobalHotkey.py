@@ -47,8 +47,11 @@ class GlobalHotkey:
         except:
             return False
 
-    def start(self):
+    def start(self, process_in_thread: bool = True):
         self.running = True
+        if not process_in_thread:
+            # Callback'ler sahibi tarafından (ör. GUI thread'inde) message_queue'dan çalıştırılır
+            return
         # Message queue işleme thread'ini başlat
         self.worker_thread = threading.Thread(target=self._process_queue, daemon=True)
         self.worker_thread.start()
@@ -0,0 +1,360 @@
+from typing import Callable, List, Optional, Tuple
+from PySide6 import QtCore
+import threading
+import time
+import logging
+from .WriteCoalescer import WriteCoalescer
+from .AdaptivePoller import AdaptivePoller
+from .TelemetryBuffer import TelemetryBuffer
+from .TelemetryHistory import TelemetryHistory
+from .TelemetryLog import TelemetryLog, read_logs
+from .WmiCallRunner import com_initialize, com_uninitialize
+from .CommandScheduler import (CommandScheduler, PRIORITY_USER_WRITE, PRIORITY_PROFILE,
+                               PRIORITY_READ, PRIORITY_DISCOVERY)
+
+class HardwareWorker(QtCore.QThread):
+    """AWCC donanım erişimini GUI thread'i dışında yürüten iş parçacığı.
+
+    FanControl bu thread içinde oluşturulur ve yalnızca burada kullanılır. AWCC
+    COM nesnesi ise WmiCallRunner'ın çağrı thread'inde yaşar; AWCC çağrıları süre
+    sınırıyla oraya iletilir. Sistem bilgisi için yapılan WMI sorguları nedeniyle
+    bu thread de COM'u başlatır. Tüm işler öncelikli tek bir kuyruktan sırayla
+    çalışır: kullanıcı yazmaları, profil uygulama, periyodik okumalar ve en son
+    arka plan taraması. Okumalar sinyal ile yayınlanır.
+    """
+    snapshotReady = QtCore.Signal(object)
+    commandFinished = QtCore.Signal(str, bool)
+    deviceDiscovered = QtCore.Signal(str, int)
+
+    # Arka plan taraması, bir sonraki okumaya bu süreden az kaldıysa bekler
+    DISCOVERY_POLL_MARGIN = 0.1
+    # Pencere gizliyken ve sıcaklık kontrolü yokken okuma aralığı
+    BACKGROUND_INTERVAL = 10.0
+    # Okuma türü başına en kısa aralık
+    MIN_INTERVAL = 0.25
+    # Açılışta diskteki günlükten geçmişe yüklenen süre; daha eskisi read_logs ile okunur
+    RESTORE_WINDOW = 6 * 3600
+    # Geçmiş yükleme işi başına okunan kayıt sayısı
+    RESTORE_CHUNK = 2000
+
+    def __init__(self, fan_control_factory: Callable, interval: float = 1.0,
+                 rpm_interval: float = 2.0, telemetry_capacity: int = 3600,
+                 telemetry_log: bool = True, parent=None) -> None:
+        super().__init__(parent)
+        self._factory = fan_control_factory
+        # Sıcaklıklar ve RPM'ler ayrı aralıklarla okunur
+        self._interval = max(self.MIN_INTERVAL, interval)
+        self._rpm_interval = max(self.MIN_INTERVAL, rpm_interval)
+        self._background = False
+        # Sıcaklık değişim hızına göre okuma aralığını ayarlayan poller. Sınırlar
+        # ayarlanan aralığı her zaman kapsar; kullanıcının seçtiği aralık kırpılmaz.
+        self._adaptive = True
+        self._adaptive_min = self.MIN_INTERVAL
+        self._adaptive_max = 5.0
+        self._poller = AdaptivePoller(self._interval, self.MIN_INTERVAL, max(self._adaptive_max, self._interval))
+        self._scheduler = CommandScheduler()
+        self._running = False
+        self._ready = threading.Event()
+        self._init_error: Optional[Exception] = None
+        self._fanControl = None
+        self._coalescer = WriteCoalescer()
+        # Okuma geçmişi (ham + dakikalık/saatlik özetler); GUI thread'inden de sorgulanabilir
+        self._telemetry = TelemetryHistory(telemetry_capacity)
+        # Geçmişin diskteki kopyası; yalnızca worker thread'inde açılır ve yazılır
+        self._log_enabled = telemetry_log
+        self._log: Optional[TelemetryLog] = None
+        # Geçmiş yüklenirken okumalar ayrı bir geçmişe yüklenir, gelen yeni okumalar
+        # sona eklenmek üzere bekletilir; bitince geçmiş tek seferde değiştirilir
+        self._restoring: Optional[TelemetryHistory] = None
+        self._restoreRecords = None
+        self._restoreBacklog: List[Tuple[float, dict]] = []
+
+    @property
+    def fanControl(self):
+        """Worker thread'inde oluşturulan FanControl nesnesi"""
+        return self._fanControl
+
+    @property
+    def telemetry(self) -> TelemetryHistory:
+        """Okumaların ve komut edilen fan hızlarının geçmişi"""
+        return self._telemetry
+
+    def setTelemetryCapacity(self, capacity: int) -> None:
+        """Ham geçmişte tutulacak en fazla okuma sayısını ayarla"""
+        self._telemetry.setCapacity(capacity)
+        restoring = self._restoring
+        if restoring is not None:
+            restoring.setCapacity(capacity)
+
+    def setTelemetryLogging(self, enabled: bool) -> None:
+        """Okuma geçmişinin diske yazılmasını aç/kapat"""
+        self._log_enabled = enabled
+        self.submit('set_telemetry_logging', self._setTelemetryLogging, enabled)
+
+    @property
+    def telemetryLogging(self) -> bool:
+        return self._log_enabled
+
+    def getTelemetryLogStats(self) -> Optional[dict]:
+        """Disk günlüğü istatistiklerini döndürür, kapalıysa None"""
+        log = self._log
+        return log.getStats() if log is not None else None
+
+    def _setTelemetryLogging(self, enabled: bool) -> bool:
+        self._log_enabled = enabled
+        if enabled and self._log is None:
+            self._log = TelemetryLog()
+        elif not enabled and self._log is not None:
+            self._log.close()
+            self._log = None
+        return True
+
+    def _startRestore(self) -> None:
+        # Yeniden başlatmadan önceki son okumalar, okumaları geciktirmemek için
+        # en düşük öncelikte parça parça geçmişe yüklenir
+        now = time.time()
+        self._restoring = TelemetryHistory(self._telemetry.capacity)
+        self._restoreRecords = read_logs(since=now - self.RESTORE_WINDOW, until=now)
+        self._restoreBacklog = []
+        self.submit('restore_telemetry', self._restoreStep, priority=PRIORITY_DISCOVERY, key='restore_telemetry')
+
+    def _restoreStep(self) -> bool:
+        restoring = self._restoring
+        try:
+            for _ in range(self.RESTORE_CHUNK):
+                timestamp, values = next(self._restoreRecords)
+                restoring.append(timestamp, values)
+        except StopIteration:
+            pass
+        except Exception as e:
+            logging.warning(f"Telemetry log restore failed: {e}")
+        else:
+            self.submit('restore_telemetry', self._restoreStep, priority=PRIORITY_DISCOVERY,
+                        key='restore_telemetry')
+            return True
+
+        # Yükleme sırasında gelen okumalar sona eklenir, zaman sırası korunur
+        for timestamp, values in self._restoreBacklog:
+            restoring.append(timestamp, values)
+        self._telemetry = restoring
+        self._restoring = None
+        self._restoreRecords = None
+        self._restoreBacklog = []
+        return True
+
+    def start(self) -> None:
+        """Thread'i başlat ve FanControl hazır olana kadar bekle"""
+        self._running = True
+        super().start()
+        self._ready.wait()
+        if self._init_error is not None:
+            self.wait()
+            raise self._init_error
+
+    def stop(self) -> None:
+        """Polling döngüsünü durdur ve thread'in bitmesini bekle"""
+        self._running = False
+        self._scheduler.wakeup()
+        self.wait(2000)
+
+    def setInterval(self, seconds: float) -> None:
+        """Sıcaklık okuma aralığını ayarla (en az 250 ms)"""
+        self._interval = max(self.MIN_INTERVAL, seconds)
+        self._applyPollerLimits()
+        self._poller.reset(self._interval)
+        self._scheduler.wakeup()  # Bekleyen döngüyü uyandır
+
+    def setRpmInterval(self, seconds: float) -> None:
+        """Fan RPM okuma aralığını ayarla (en az 250 ms)"""
+        self._rpm_interval = max(self.MIN_INTERVAL, seconds)
+        self._scheduler.wakeup()
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def rpmInterval(self) -> float:
+        return self._rpm_interval
+
+    def setAdaptivePolling(self, enabled: bool, min_interval: Optional[float] = None,
+                           max_interval: Optional[float] = None) -> None:
+        """Uyarlamalı okumayı aç/kapat ve aralık sınırlarını ayarla (saniye)"""
+        self._adaptive = enabled
+        if min_interval is not None:
+            self._adaptive_min = max(self.MIN_INTERVAL, min_interval)
+        if max_interval is not None:
+            self._adaptive_max = max(self.MIN_INTERVAL, max_interval)
+        self._applyPollerLimits()
+        self._scheduler.wakeup()
+
+    def _applyPollerLimits(self) -> None:
+        # Ayarlanan aralık sınırların dışındaysa sınırlar onu içerecek şekilde genişler
+        self._poller.setLimits(min(self._adaptive_min, self._interval),
+                               max(self._adaptive_max, self._interval))
+
+    def getPollingStats(self) -> dict:
+        """Etkin okuma aralığını ve uyarlamalı okuma sınırlarını döndürür"""
+        stats = self._poller.getStats()
+        stats['adaptive'] = self._adaptive
+        # Kaydedilen sınırlar kullanıcının ayarladıklarıdır, aralığa göre genişletilmiş olanlar değil
+        stats['min_interval_ms'] = self._adaptive_min * 1000
+        stats['max_interval_ms'] = self._adaptive_max * 1000
+        stats['interval_ms'] = self._pollInterval() * 1000 if self._fanControl is not None else self._interval * 1000
+        stats['rpm_interval_ms'] = self._rpmPollInterval() * 1000 if self._fanControl is not None else self._rpm_interval * 1000
+        return stats
+
+    def setBackground(self, background: bool) -> None:
+        """Pencere gizliyken, okumaya bağlı kontrol yoksa okumalar seyrekleşir"""
+        self._background = background
+        self._scheduler.wakeup()
+
+    def _pollInterval(self) -> float:
+        interval = self._poller.interval if self._adaptive else self._interval
+        if self._background and not self._fanControl.hasActiveControl():
+            return max(interval, self.BACKGROUND_INTERVAL)
+        return interval
+
+    def _rpmPollInterval(self) -> float:
+        if self._background and not self._fanControl.hasActiveControl():
+            return max(self._rpm_interval, self.BACKGROUND_INTERVAL)
+        return self._rpm_interval
+
+    def submit(self, name: str, method, *args, priority: int = PRIORITY_PROFILE, key=None) -> None:
+        """FanControl üzerinde çalıştırılacak bir komutu kuyruğa ekle"""
+        self._scheduler.submit(priority, name, method, *args, key=key)
+
+    def setFanSpeed(self, fanId: int, speed: int) -> None:
+        """Fan hızı yazmasını kuyruğa ekle, bekleyen eski hedef varsa yenisiyle değiştir"""
+        if self._coalescer.submit(fanId, speed):
+            self.submit('set_fan_speed', self._flushFanSpeed, fanId, priority=PRIORITY_USER_WRITE)
+
+    def getWriteStats(self) -> dict:
+        """Birleştirilen fan hızı yazma istatistiklerini döndürür"""
+        return self._coalescer.getStats()
+
+    def getSchedulerStats(self) -> dict:
+        """Öncelik başına kuyruk derinliği ve bekleme sürelerini döndürür"""
+        return self._scheduler.getStats()
+
+    def applyProfile(self, profile_name: str) -> None:
+        # Henüz uygulanmamış eski profil isteği yenisiyle değiştirilir
+        self.submit('apply_profile', 'apply_profile', profile_name, key='apply_profile')
+
+    def startDiscovery(self) -> None:
+        """Düşük öncelikli fan/sensör taramasını başlat"""
+        self.submit('start_discovery', 'startDiscovery', priority=PRIORITY_DISCOVERY)
+
+    def run(self) -> None:
+        com_started = com_initialize()
+        try:
+            try:
+                self._fanControl = self._factory()
+            except Exception as e:
+                self._init_error = e
+                return
+            finally:
+                self._ready.set()
+
+            if self._log_enabled:
+                self._startRestore()
+                self._setTelemetryLogging(True)
+
+            last_temps = None
+            last_rpms = None
+            while self._running:
+                now = time.monotonic()
+                temp_interval = self._pollInterval()
+                rpm_interval = self._rpmPollInterval()
+                
+                if last_temps is None or now >= last_temps + temp_interval:
+                    # Henüz çalışmamış eski okuma varsa yenisiyle değiştirilir
+                    self._scheduler.submit(PRIORITY_READ, 'read_temps', self._poll, True, False,
+                                           key='read_temps')
+                    last_temps = now
+                    if last_rpms is not None and now >= last_rpms + rpm_interval:
+                        # Aynı turda iki tür okunmasın: RPM okuması yarım sıcaklık aralığı kaydırılır
+                        last_rpms = now - rpm_interval + temp_interval / 2
+                if last_rpms is None or now >= last_rpms + rpm_interval:
+                    self._scheduler.submit(PRIORITY_READ, 'read_rpms', self._poll, False, True,
+                                           key='read_rpms')
+                    last_rpms = now
+                
+                # Aralık kısalırsa (ör. pencere açıldı) bir sonraki okuma hemen öne çekilir
+                next_poll = min(last_temps + temp_interval, last_rpms + rpm_interval)
+
+                timeout = next_poll - now
+                discovering = self._fanControl.discoveryPending()
+                if discovering:
+                    timeout = min(timeout, self._fanControl.discoveryNextDueIn())
+                command = self._scheduler.get(timeout=max(0.0, timeout))
+                if command is not None:
+                    self._execute(command)
+                    continue
+
+                # Boşta kalan süreyi arka plan taramasına kullan
+                if (discovering and self._fanControl.discoveryNextDueIn() <= 0
+                        and next_poll - time.monotonic() >= self.DISCOVERY_POLL_MARGIN):
+                    self._scheduler.submit(PRIORITY_DISCOVERY, 'discover_step', self._discoverStep,
+                                           key='discover_step')
+        finally:
+            if self._log is not None:
+                self._log.close()
+            if com_started:
+                com_uninitialize()
+
+    def _poll(self, read_temps: bool, read_rpms: bool) -> None:
+        try:
+            snapshot = self._fanControl.read_snapshot(read_temps, read_rpms)
+            self.snapshotReady.emit(snapshot)
+            if read_temps:
+                # Kontrol ve uyarlamalı aralık yalnızca yeni sıcaklıklarla çalışır
+                self._poller.update(snapshot, self._fanControl.isNearControlPoint(snapshot))
+                self._fanControl.runControl(snapshot)
+            self._fanControl.reassertCommanded()
+            values = TelemetryBuffer.snapshotValues(snapshot, self._fanControl.getCommandedStats()['commanded'])
+            self._telemetry.append(snapshot.timestamp, values)
+            if self._restoring is not None:
+                self._restoreBacklog.append((snapshot.timestamp, values))
+        except Exception as e:
+            logging.error(f"Snapshot read failed: {e}")
+            return
+        if self._log is not None:
+            try:
+                self._log.append(snapshot.timestamp, values)
+            except OSError as e:
+                # Disk dolu vb. durumlarda okumalar sürer, yalnızca günlük kapanır
+                logging.error(f"Telemetry log write failed, logging disabled: {e}")
+                self._setTelemetryLogging(False)
+
+    def _discoverStep(self) -> None:
+        try:
+            found = self._fanControl.discoverStep()
+        except Exception as e:
+            logging.error(f"Discovery step failed: {e}")
+            return
+        if found:
+            self.deviceDiscovered.emit(*found)
+
+    def _flushFanSpeed(self, fanId: int) -> bool:
+        # Elle verilen hız, fanın sıcaklık kontrolünü devralır
+        self._fanControl.releaseControl(fanId)
+        # Yazma sürerken gelen yeni hedefler bir sonraki turda yazılır
+        ok = True
+        speed = self._coalescer.take(fanId)
+        while speed is not None:
+            ok = self._fanControl.setFanSpeed(fanId, speed)
+            speed = self._coalescer.take(fanId)
+        return ok
+
+    def _execute(self, command) -> None:
+        try:
+            method = command.func
+            target = method if callable(method) else getattr(self._fanControl, method)
+            ok = bool(target(*command.args))
+        except Exception as e:
+            logging.error(f"Hardware command {command.name} failed: {e}")
+            ok = False
+        # Periyodik okuma ve tarama adımları için sinyal gönderilmez
+        if command.priority < PRIORITY_READ:
+            self.commandFinished.emit(command.name, ok)
@@ -1,8 +1,12 @@
 from enum import Enum
 from typing import Optional, Tuple, Union, NewType
-import wmi
 import time
 
+try:
+    import wmi
+except ImportError:  # wmi yalnızca Windows'ta bulunur
+    wmi = None
+
 # DetectHardware class
 class DetectHardware:
     CPUFanIdx = 0
@@ -38,6 +42,21 @@ class DetectHardware:
             print(f"Error getting hardware name: {e}")
             return None
 
+    def getSystemKey(self) -> Optional[str]:
+        """Sistem modeli ve BIOS sürümünden oluşan benzersiz anahtarı döndürür"""
+        try:
+            system = self._wmi.Win32_ComputerSystem()[0]
+            bios = self._wmi.Win32_BIOS()[0]
+            parts = [
+                getattr(system, 'Manufacturer', None),
+                getattr(system, 'Model', None),
+                getattr(bios, 'SMBIOSBIOSVersion', None)
+            ]
+            return "|".join(str(p).strip() for p in parts if p)
+        except Exception as e:
+            print(f"Error getting system key: {e}")
+            return None
+
 # Required classes for AWCC
 class NoAWCCWMIClass(Exception):
     def __init__(self) -> None:
@@ -58,7 +77,7 @@ class AWCCWmiWrapper:
         Balanced = 0x97
         G_Mode = 0xAB
 
-    def __init__(self, awcc: wmi._wmi_object) -> None:
+    def __init__(self, awcc: "wmi._wmi_object") -> None:
         self._awcc = awcc
         self._detected_ids = self._detect_fan_sensor_ids()
 
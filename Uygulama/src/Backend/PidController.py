@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class PidGains:
+    kp: float = 4.0
+    ki: float = 0.15
+    kd: float = 2.0
+
+    def to_dict(self) -> dict:
+        return {"kp": self.kp, "ki": self.ki, "kd": self.kd}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PidGains":
+        return cls(kp=data.get("kp", cls.kp), ki=data.get("ki", cls.ki), kd=data.get("kd", cls.kd))
+
+class PidController:
+    """Bir sensörü hedef sıcaklıkta tutmak için fan hızını ayarlayan PID kontrolcü.
+
+    Hata = sıcaklık - hedef; sıcaklık hedefin üstündeyse fan hızlanır. İntegral
+    terimi çıkış sınırlarına kırpılır ve çıkış doyumdayken aynı yönde büyümez
+    (anti-windup). Türev, hedef değişiminde sıçrama olmaması için ölçümden alınır.
+    """
+
+    def __init__(self, sensor_id: int, target: float, gains: Optional[PidGains] = None,
+                 initial_output: float = 50.0, output_min: int = 0, output_max: int = 100) -> None:
+        self.sensor_id = sensor_id
+        self.target = target
+        self.gains = gains if gains is not None else PidGains()
+        self.output_min = output_min
+        self.output_max = output_max
+
+        # Profil değişiminde sarsıntı olmaması için integral mevcut hızdan başlar
+        self.integral = float(min(output_max, max(output_min, initial_output)))
+        self.error = 0.0
+        self.derivative = 0.0
+        self.output: Optional[int] = None
+        self._last_temp: Optional[float] = None
+        self._last_time: Optional[float] = None
+
+    def update(self, temp: Optional[int], now: float, projected: Optional[float] = None) -> Optional[int]:
+        """Yeni sıcaklık için fan hızını (%) döndürür, okunamadıysa None.
+
+        Eğilim zaten türev teriminde olduğundan projected kullanılmaz.
+        """
+        if temp is None:
+            return None
+
+        dt = 0.0 if self._last_time is None else max(0.0, now - self._last_time)
+        self.error = temp - self.target
+        self.derivative = (temp - self._last_temp) / dt if dt > 0 and self._last_temp is not None else 0.0
+
+        proportional = self.gains.kp * self.error
+        damping = self.gains.kd * self.derivative
+        unclamped = proportional + self.integral + damping
+
+        # Anti-windup: çıkış doyumdaysa integrali doyumu artıracak yönde büyütme
+        step = self.gains.ki * self.error * dt
+        if not ((unclamped >= self.output_max and step > 0) or (unclamped <= self.output_min and step < 0)):
+            self.integral = min(self.output_max, max(self.output_min, self.integral + step))
+
+        output = proportional + self.integral + damping
+        self.output = int(round(min(self.output_max, max(self.output_min, output))))
+        self._last_temp = temp
+        self._last_time = now
+        return self.output
+
+    def getState(self) -> dict:
+        """Çizim için kontrolcü iç durumunu döndürür"""
+        return {
+            'target': self.target,
+            'error': self.error,
+            'integral': self.integral,
+            'derivative': self.derivative,
+            'output': self.output
+        }
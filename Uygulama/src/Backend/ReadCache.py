@@ -0,0 +1,94 @@
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import threading
+import time
+
+class _InFlight:
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+class ReadCache:
+    """(metod, argüman) anahtarlı, okuma türüne göre kısa ömürlü okuma önbelleği.
+
+    Aynı anahtar için eşzamanlı gelen istekler tek bir WMI çağrısında birleştirilir
+    (single-flight): ilk gelen çağrıyı yapar, diğerleri onun sonucunu bekler.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None) -> None:
+        self._lock = threading.Lock()
+        self._ttls: Dict[str, float] = dict(ttls or {})
+        self._entries: Dict[Hashable, Tuple[float, object]] = {}
+        self._inflight: Dict[Hashable, _InFlight] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    def setTtl(self, kind: str, seconds: float) -> None:
+        """Bir okuma türü için önbellek süresini ayarla (0 = önbellek kapalı)"""
+        with self._lock:
+            self._ttls[kind] = max(0.0, seconds)
+
+    def get(self, key: Hashable, kind: str, loader: Callable[[], Tuple[object, bool]]):
+        """Önbellekteki değeri döndür, yoksa loader ile oku.
+
+        loader (değer, önbelleğe_alınabilir) döndürmelidir.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self._ttls.get(kind, 0.0):
+                self.hits += 1
+                return entry[1]
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _InFlight()
+                self._inflight[key] = flight
+                self.misses += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            # Aynı anahtar zaten okunuyor, onun sonucunu bekle
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value, cacheable = loader()
+            flight.value = value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if flight.error is None and cacheable:
+                    self._entries[key] = (time.monotonic(), flight.value)
+                self._inflight.pop(key, None)
+            flight.done.set()
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Bir anahtarı (veya tüm önbelleği) geçersiz kıl"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def getStats(self) -> dict:
+        """İsabet, ıskalama ve birleştirilen istek sayılarını döndürür"""
+        with self._lock:
+            total = self.hits + self.misses + self.shared
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'shared': self.shared,
+                'hit_rate': (self.hits + self.shared) / total if total else 0.0,
+                'ttls_ms': {kind: ttl * 1000 for kind, ttl in self._ttls.items()}
+            }
@@ -0,0 +1,79 @@
+from typing import Iterable, Optional, Tuple
+from collections import deque
+import time
+
+class SensorDiscovery:
+    """Tüm sensör (0x01-0x30) ve fan (0x31-0x63) ID uzayını arka planda parça parça tarar.
+
+    Her step() çağrısı en fazla bir ID okur ve çağrılar arasında en az
+    min_probe_interval kadar süre bırakır. Bir ID ilk geçerli okumadan sonra
+    aday olur, taramanın sonunda ikinci kez geçerli okunursa doğrulanmış sayılır.
+    """
+
+    def __init__(self, awcc, known_fans: Iterable[int], known_sensors: Iterable[int],
+                 min_probe_interval: float = 0.25) -> None:
+        self._awcc = awcc
+        self._min_probe_interval = min_probe_interval
+        self._last_probe = 0.0
+        self._candidates = set()
+        self._queue = deque()
+
+        known_fans = set(known_fans)
+        known_sensors = set(known_sensors)
+        for sensor_id in range(awcc.SENSOR_ID_FIRST, awcc.SENSOR_ID_LAST + 1):
+            if sensor_id not in known_sensors:
+                self._queue.append(('sensor', sensor_id))
+        for fan_id in range(awcc.FAN_ID_FIRST, awcc.FAN_ID_LAST + 1):
+            if fan_id not in known_fans:
+                self._queue.append(('fan', fan_id))
+
+        self.probes = 0
+
+    @property
+    def done(self) -> bool:
+        return not self._queue
+
+    @property
+    def remaining(self) -> int:
+        return len(self._queue)
+
+    def isDue(self, now: Optional[float] = None) -> bool:
+        """Hız sınırına göre bir sonraki okumanın yapılıp yapılamayacağını döndürür"""
+        if now is None:
+            now = time.monotonic()
+        return bool(self._queue) and now - self._last_probe >= self._min_probe_interval
+
+    def nextDueIn(self, now: Optional[float] = None) -> float:
+        """Bir sonraki okumaya kalan süreyi döndürür"""
+        if now is None:
+            now = time.monotonic()
+        return max(0.0, self._last_probe + self._min_probe_interval - now)
+
+    def step(self) -> Optional[Tuple[str, int]]:
+        """Sıradaki ID'yi oku, doğrulanan yeni bir fan/sensör varsa (tür, id) döndür"""
+        if not self._queue:
+            return None
+
+        kind, item_id = self._queue.popleft()
+        self._last_probe = time.monotonic()
+        self.probes += 1
+
+        if kind == 'sensor':
+            value = self._awcc.GetSensorTemperature(item_id)
+            valid = value is not None and 0 < value <= 125
+        else:
+            value = self._awcc.GetFanRPM(item_id)
+            valid = value is not None
+
+        key = (kind, item_id)
+        if not valid:
+            self._candidates.discard(key)
+            return None
+        if key in self._candidates:
+            self._candidates.discard(key)
+            return key
+
+        # İlk geçerli okuma: taramanın sonunda tekrar kontrol et
+        self._candidates.add(key)
+        self._queue.append(key)
+        return None
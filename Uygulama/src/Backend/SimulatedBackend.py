@@ -0,0 +1,155 @@
+from typing import Callable, Dict, Optional
+import math
+import threading
+import time
+
+INVALID = 0xFFFFFFFF
+
+# Firmware termal modları (AWCCWmiWrapper.ThermalMode değerleri)
+MODE_CUSTOM = 0
+MODE_BALANCED = 0x97
+MODE_G_MODE = 0xAB
+
+def load_profile(name: str) -> Callable[[float], float]:
+    """Adı verilen yük profilini döndürür: zaman (s) -> yük (0-1)"""
+    if name == 'idle':
+        return lambda t: 0.05
+    if name == 'constant':
+        return lambda t: 0.6
+    if name == 'square':
+        # 60 s yük, 60 s boşta
+        return lambda t: 0.9 if (t % 120.0) < 60.0 else 0.05
+    if name == 'ramp':
+        # 5 dakikada %0'dan %100'e
+        return lambda t: min(1.0, t / 300.0)
+    if name == 'burst':
+        # Her 30 s'de 5 s'lik ani yük
+        return lambda t: 1.0 if (t % 30.0) < 5.0 else 0.1
+    raise ValueError(f"Unknown load profile: {name}")
+
+class _ThermalZone:
+    """Tek bir fan ve ona bağlı sensörün birinci dereceden ısıl modeli"""
+
+    def __init__(self, ambient: float, heat_idle: float, heat_max: float, cooling: float,
+                 capacity: float, min_rpm: int, max_rpm: int, rpm_tau: float) -> None:
+        self.ambient = ambient
+        self.heat_idle = heat_idle
+        self.heat_max = heat_max
+        self.cooling = cooling
+        self.capacity = capacity
+        self.min_rpm = min_rpm
+        self.max_rpm = max_rpm
+        self.rpm_tau = rpm_tau
+        self.temp = ambient + 10.0
+        self.rpm = 0.0
+        self.duty = 0
+        self.mode = MODE_CUSTOM
+
+    def _effectiveDuty(self) -> float:
+        # Firmware modunda fan hızını firmware kendi eğrisiyle belirler
+        if self.mode == MODE_G_MODE:
+            return 100.0
+        if self.mode == MODE_BALANCED:
+            return min(100.0, max(20.0, (self.temp - 45.0) * 2.0))
+        return float(self.duty)
+
+    def step(self, dt: float, load: float) -> None:
+        # Isı girişi yükle, soğutma fan hızı ve ortam farkı ile orantılı
+        heat = self.heat_idle + load * (self.heat_max - self.heat_idle)
+        # Fan kapalıyken de pasif soğutma vardır
+        cooling = self.cooling * (0.15 + self.rpm / self.max_rpm) * (self.temp - self.ambient)
+        self.temp += (heat - cooling) * dt / self.capacity
+
+        # RPM komut verilen hıza gecikmeli yaklaşır, %0'da fan en düşük devirde döner
+        target_rpm = self.min_rpm + (self.max_rpm - self.min_rpm) * self._effectiveDuty() / 100.0
+        self.rpm += (target_rpm - self.rpm) * (1.0 - math.exp(-dt / self.rpm_tau))
+
+class SimulatedThermalBackend:
+    """AWCC WMI nesnesinin yerine geçen ısıl simülasyon (ThermalBackend).
+
+    Isı girişi bir yük profilinden gelir, soğutma komut verilen fan hızıyla
+    artar, RPM komuta gecikmeli tepki verir. Model gerçek zamanla (time_scale
+    ile hızlandırılarak) ilerler; testler için advance() ile elle de ilerletilebilir.
+    """
+
+    CPU_FAN_ID = 0x32
+    GPU_FAN_ID = 0x33
+    CPU_SENSOR_ID = 0x01
+    GPU_SENSOR_ID = 0x06
+
+    def __init__(self, load: Optional[Callable[[float], float]] = None, time_scale: float = 1.0,
+                 call_latency: float = 0.0, realtime: bool = True) -> None:
+        self._lock = threading.Lock()
+        self._load = load if load is not None else load_profile('square')
+        self._time_scale = time_scale
+        self._call_latency = call_latency
+        self._realtime = realtime
+        self._sim_time = 0.0
+        self._last_wall = time.monotonic()
+
+        self._zones: Dict[int, _ThermalZone] = {
+            self.CPU_FAN_ID: _ThermalZone(ambient=30.0, heat_idle=8.0, heat_max=60.0, cooling=2.0,
+                                          capacity=40.0, min_rpm=1200, max_rpm=5200, rpm_tau=2.0),
+            self.GPU_FAN_ID: _ThermalZone(ambient=30.0, heat_idle=6.0, heat_max=80.0, cooling=2.2,
+                                          capacity=60.0, min_rpm=1100, max_rpm=5000, rpm_tau=2.5),
+        }
+        self._sensors = {
+            self.CPU_SENSOR_ID: self.CPU_FAN_ID,
+            self.GPU_SENSOR_ID: self.GPU_FAN_ID,
+        }
+
+    @property
+    def sim_time(self) -> float:
+        return self._sim_time
+
+    def advance(self, seconds: float, step: float = 0.1) -> None:
+        """Modeli verilen simülasyon süresi kadar ilerlet"""
+        with self._lock:
+            self._advance(seconds, step)
+
+    def _advance(self, seconds: float, step: float = 0.1) -> None:
+        while seconds > 0:
+            dt = min(step, seconds)
+            load = max(0.0, min(1.0, self._load(self._sim_time)))
+            for zone in self._zones.values():
+                zone.step(dt, load)
+            self._sim_time += dt
+            seconds -= dt
+
+    def _sync(self) -> None:
+        if not self._realtime:
+            return
+        now = time.monotonic()
+        elapsed = (now - self._last_wall) * self._time_scale
+        self._last_wall = now
+        self._advance(elapsed)
+
+    def Thermal_Information(self, arg: int):
+        if self._call_latency:
+            time.sleep(self._call_latency)
+        op = arg & 0xFF
+        item_id = (arg >> 8) & 0xFF
+        with self._lock:
+            self._sync()
+            if op == 5 and item_id in self._zones:
+                return (int(round(self._zones[item_id].rpm)),)
+            if op == 4 and item_id in self._sensors:
+                return (int(round(self._zones[self._sensors[item_id]].temp)),)
+        return (INVALID,)
+
+    def Thermal_Control(self, arg: int):
+        if self._call_latency:
+            time.sleep(self._call_latency)
+        op = arg & 0xFF
+        item_id = (arg >> 8) & 0xFF
+        value = (arg >> 16) & 0xFF
+        with self._lock:
+            self._sync()
+            if op == 2 and item_id in self._zones:
+                self._zones[item_id].duty = max(0, min(100, value))
+                return (0,)
+            if op == 1 and item_id in (MODE_CUSTOM, MODE_BALANCED, MODE_G_MODE):
+                for zone in self._zones.values():
+                    zone.mode = item_id
+                return (0,)
+        return (1,)
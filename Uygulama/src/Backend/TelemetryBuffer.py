@@ -0,0 +1,209 @@
+from array import array
+from typing import Dict, List, Mapping, Optional, Tuple
+import math
+import threading
+import time
+
+NAN = float('nan')
+
+class TelemetryBuffer:
+    """Okuma geçmişini sabit boyutlu halka tamponlarda tutar.
+
+    Her kanal (zaman damgası, sensör sıcaklıkları, fan RPM'leri, komut edilen
+    fan hızları) capacity elemanlık önceden ayrılmış bir array('d') sütunudur.
+    Ekleme O(1)'dir ve bellek ayırmaz; yalnızca ilk kez görülen bir kanal için
+    sütun bir kez ayrılır. Okunamayan değerler NaN olarak saklanır.
+    """
+
+    def __init__(self, capacity: int = 3600) -> None:
+        self._lock = threading.Lock()
+        self._allocate(capacity)
+        self.appended = 0
+
+    def _allocate(self, capacity: int) -> None:
+        self.capacity = max(1, int(capacity))
+        self._timestamps = array('d', [NAN]) * self.capacity
+        self._columns: Dict[str, array] = {}
+        self._head = 0  # Bir sonraki yazılacak satır
+        self._count = 0
+
+    @staticmethod
+    def sensorChannel(sensorId: int) -> str:
+        return f"sensor_0x{sensorId:02X}"
+
+    @staticmethod
+    def fanChannel(fanId: int) -> str:
+        return f"fan_0x{fanId:02X}"
+
+    @staticmethod
+    def dutyChannel(fanId: int) -> str:
+        return f"duty_0x{fanId:02X}"
+
+    def _column(self, channel: str) -> array:
+        column = self._columns.get(channel)
+        if column is None:
+            column = self._columns[channel] = array('d', [NAN]) * self.capacity
+        return column
+
+    def append(self, timestamp: float, values: Mapping[str, Optional[float]]) -> None:
+        """Bir satır ekle; values'ta olmayan kanallar bu satır için NaN olur"""
+        with self._lock:
+            row = self._head
+            self._timestamps[row] = timestamp
+            for channel, column in self._columns.items():
+                value = values.get(channel)
+                column[row] = NAN if value is None else value
+            for channel, value in values.items():
+                if channel not in self._columns:
+                    self._column(channel)[row] = NAN if value is None else value
+            self._head = (row + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self.appended += 1
+
+    @classmethod
+    def snapshotValues(cls, snapshot, commanded: Optional[Mapping[int, int]] = None) -> Dict[str, Optional[float]]:
+        """ThermalSnapshot'ı ve komut edilen fan hızlarını (%) kanal -> değer sözlüğüne çevirir"""
+        values: Dict[str, Optional[float]] = {}
+        for sensorId, temp in snapshot.temperatures:
+            values[cls.sensorChannel(sensorId)] = temp
+        for fanId, rpm in snapshot.fan_rpms:
+            values[cls.fanChannel(fanId)] = rpm
+            values[cls.dutyChannel(fanId)] = (commanded or {}).get(fanId)
+        return values
+
+    def appendSnapshot(self, snapshot, commanded: Optional[Mapping[int, int]] = None) -> None:
+        """ThermalSnapshot'ı ve komut edilen fan hızlarını (%) tek satır olarak ekle"""
+        self.append(snapshot.timestamp, self.snapshotValues(snapshot, commanded))
+
+    def setCapacity(self, capacity: int) -> None:
+        """Tampon boyutunu değiştir; en yeni satırlar korunur"""
+        with self._lock:
+            capacity = max(1, int(capacity))
+            if capacity == self.capacity:
+                return
+            keep = min(self._count, capacity)
+            rows = [self._row(i) for i in range(self._count - keep, self._count)]
+            timestamps = [self._timestamps[row] for row in rows]
+            columns = {channel: [column[row] for row in rows] for channel, column in self._columns.items()}
+            self._allocate(capacity)
+            self._timestamps[:keep] = array('d', timestamps)
+            for channel, values in columns.items():
+                self._column(channel)[:keep] = array('d', values)
+            self._count = keep
+            self._head = keep % self.capacity
+
+    def clear(self) -> None:
+        with self._lock:
+            self._allocate(self.capacity)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def channels(self) -> List[str]:
+        return list(self._columns)
+
+    @property
+    def memoryBytes(self) -> int:
+        """Sütunların kapladığı bellek (bayt)"""
+        return self.capacity * self._timestamps.itemsize * (1 + len(self._columns))
+
+    def _row(self, index: int) -> int:
+        # index 0 en eski satırdır
+        return (self._head - self._count + index) % self.capacity
+
+    def _windowStart(self, since: float) -> int:
+        # Zaman damgaları eklenme sırasıyla arttığından ikili arama yeterli
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._timestamps[self._row(mid)] < since:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _windowRows(self, seconds: Optional[float], now: Optional[float]) -> range:
+        if seconds is None:
+            return range(0, self._count)
+        if now is None:
+            now = time.time()
+        return range(self._windowStart(now - seconds), self._count)
+
+    def oldest(self) -> Optional[float]:
+        """En eski satırın zaman damgası, tampon boşsa None"""
+        with self._lock:
+            return self._timestamps[self._row(0)] if self._count else None
+
+    def windowCount(self, seconds: float, now: Optional[float] = None) -> int:
+        """Son seconds saniyedeki satır sayısı"""
+        with self._lock:
+            return len(self._windowRows(seconds, now))
+
+    def latest(self, channel: str) -> Optional[float]:
+        """Kanalın en son geçerli değeri"""
+        with self._lock:
+            column = self._columns.get(channel)
+            if column is None:
+                return None
+            for index in range(self._count - 1, -1, -1):
+                value = column[self._row(index)]
+                if not math.isnan(value):
+                    return value
+            return None
+
+    def series(self, channel: str, seconds: Optional[float] = None,
+               now: Optional[float] = None) -> List[Tuple[float, float]]:
+        """Son seconds saniyedeki (zaman, değer) çiftleri; NaN değerler atlanır"""
+        with self._lock:
+            column = self._columns.get(channel)
+            if column is None:
+                return []
+            points = []
+            for index in self._windowRows(seconds, now):
+                row = self._row(index)
+                value = column[row]
+                if not math.isnan(value):
+                    points.append((self._timestamps[row], value))
+            return points
+
+    def stats(self, channel: str, seconds: Optional[float] = None,
+              now: Optional[float] = None) -> Optional[dict]:
+        """Son seconds saniye için min, max, ortalama ve örnek sayısı; veri yoksa None"""
+        with self._lock:
+            column = self._columns.get(channel)
+            if column is None:
+                return None
+            count = 0
+            total = 0.0
+            low = math.inf
+            high = -math.inf
+            for index in self._windowRows(seconds, now):
+                value = column[self._row(index)]
+                if math.isnan(value):
+                    continue
+                count += 1
+                total += value
+                if value < low:
+                    low = value
+                if value > high:
+                    high = value
+            if count == 0:
+                return None
+            return {'min': low, 'max': high, 'mean': total / count, 'count': count}
+
+    def getStats(self) -> dict:
+        """Tampon doluluğu ve bellek kullanımını döndürür"""
+        with self._lock:
+            span = 0.0
+            if self._count > 1:
+                span = self._timestamps[self._row(self._count - 1)] - self._timestamps[self._row(0)]
+            return {
+                'capacity': self.capacity,
+                'samples': self._count,
+                'appended': self.appended,
+                'channels': len(self._columns),
+                'memory_bytes': self.memoryBytes,
+                'span_s': span
+            }
@@ -0,0 +1,260 @@
+from array import array
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+import math
+import threading
+import time
+from .TelemetryBuffer import TelemetryBuffer, NAN
+
+class RollupTier:
+    """Okumaları resolution saniyelik kovalarda özetleyen sabit boyutlu halka.
+
+    Her kova, kanal başına min, max, ortalama, son değer ve örnek sayısını tutar.
+    Yeni örnek en yeni kovayı yerinde günceller; kova sınırı geçilince bir sonraki
+    satıra geçilir. Okuma olmayan aralıklar için kova açılmaz.
+    """
+
+    def __init__(self, resolution: float, capacity: int) -> None:
+        self.resolution = float(resolution)
+        self.capacity = max(1, int(capacity))
+        self._starts = array('d', [NAN]) * self.capacity
+        # kanal -> (min, max, ortalama, son, sayı)
+        self._columns: Dict[str, Tuple[array, array, array, array, array]] = {}
+        self._head = 0
+        self._count = 0
+        self._bucket: Optional[int] = None
+
+    def _column(self, channel: str) -> Tuple[array, array, array, array, array]:
+        columns = self._columns.get(channel)
+        if columns is None:
+            columns = self._columns[channel] = (
+                array('d', [NAN]) * self.capacity,
+                array('d', [NAN]) * self.capacity,
+                array('d', [NAN]) * self.capacity,
+                array('d', [NAN]) * self.capacity,
+                array('I', [0]) * self.capacity
+            )
+        return columns
+
+    def add(self, timestamp: float, values: Mapping[str, Optional[float]]) -> None:
+        bucket = int(timestamp // self.resolution)
+        if self._bucket is not None and bucket < self._bucket:
+            return  # Saat geri alındıysa eski kovalar değiştirilmez
+        if bucket != self._bucket:
+            row = self._head
+            self._starts[row] = bucket * self.resolution
+            for low, high, mean, last, count in self._columns.values():
+                low[row] = high[row] = mean[row] = last[row] = NAN
+                count[row] = 0
+            self._head = (row + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self._bucket = bucket
+
+        row = (self._head - 1) % self.capacity
+        for channel, value in values.items():
+            if value is None:
+                continue
+            low, high, mean, last, count = self._column(channel)
+            n = count[row] + 1
+            if n == 1:
+                low[row] = high[row] = mean[row] = value
+            else:
+                if value < low[row]:
+                    low[row] = value
+                if value > high[row]:
+                    high[row] = value
+                mean[row] += (value - mean[row]) / n
+            last[row] = value
+            count[row] = n
+
+    def clear(self) -> None:
+        self._starts = array('d', [NAN]) * self.capacity
+        self._columns.clear()
+        self._head = 0
+        self._count = 0
+        self._bucket = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def memoryBytes(self) -> int:
+        per_row = self._starts.itemsize + sum(column.itemsize for columns in self._columns.values()
+                                              for column in columns)
+        return self.capacity * per_row
+
+    def _row(self, index: int) -> int:
+        return (self._head - self._count + index) % self.capacity
+
+    def _windowStart(self, since: float) -> int:
+        # Başlangıcı since'den önce olsa da since'i içeren kova pencereye dahildir
+        since -= self.resolution
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._starts[self._row(mid)] <= since:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def oldest(self) -> Optional[float]:
+        return self._starts[self._row(0)] if self._count else None
+
+    def windowCount(self, since: float) -> int:
+        return self._count - self._windowStart(since)
+
+    def points(self, channel: str, since: float) -> List[Tuple[float, float, float, float, float]]:
+        """since'ten bu yana (kova başı, min, max, ortalama, son) satırları"""
+        columns = self._columns.get(channel)
+        if columns is None:
+            return []
+        low, high, mean, last, count = columns
+        result = []
+        for index in range(self._windowStart(since), self._count):
+            row = self._row(index)
+            if count[row]:
+                result.append((self._starts[row], low[row], high[row], mean[row], last[row]))
+        return result
+
+    def stats(self, channel: str, since: float) -> Optional[dict]:
+        columns = self._columns.get(channel)
+        if columns is None:
+            return None
+        low, high, mean, last, count = columns
+        samples = 0
+        total = 0.0
+        minimum = math.inf
+        maximum = -math.inf
+        for index in range(self._windowStart(since), self._count):
+            row = self._row(index)
+            n = count[row]
+            if not n:
+                continue
+            samples += n
+            total += mean[row] * n
+            minimum = min(minimum, low[row])
+            maximum = max(maximum, high[row])
+        if samples == 0:
+            return None
+        return {'min': minimum, 'max': maximum, 'mean': total / samples, 'count': samples}
+
+class TelemetryHistory:
+    """Ham okuma tamponu ile dakikalık ve saatlik özet katmanlarını birlikte tutar.
+
+    Her okuma ham tampona eklenir ve özet katmanlarını artımlı günceller. Sorgular,
+    istenen süreyi tamamen kapsayan ve en fazla max_points nokta döndüren en ince
+    katmandan cevaplanır; böylece 30 günlük bir grafik saatlik katmandan birkaç yüz
+    nokta okur.
+    """
+
+    # (çözünürlük saniye, kova sayısı): 7 gün dakikalık, 90 gün saatlik
+    TIERS: Sequence[Tuple[float, int]] = ((60, 7 * 24 * 60), (3600, 90 * 24))
+
+    def __init__(self, raw_capacity: int = 3600, tiers: Optional[Sequence[Tuple[float, int]]] = None,
+                 max_points: int = 4000) -> None:
+        self._lock = threading.Lock()
+        self.raw = TelemetryBuffer(raw_capacity)
+        self.tiers = [RollupTier(resolution, capacity) for resolution, capacity in (tiers or self.TIERS)]
+        self.max_points = max_points
+        self._first: Optional[float] = None
+
+    @property
+    def capacity(self) -> int:
+        return self.raw.capacity
+
+    def setCapacity(self, capacity: int) -> None:
+        """Ham tampondaki en fazla okuma sayısını ayarla"""
+        self.raw.setCapacity(capacity)
+
+    def append(self, timestamp: float, values: Mapping[str, Optional[float]]) -> None:
+        self.raw.append(timestamp, values)
+        with self._lock:
+            if self._first is None:
+                self._first = timestamp
+            for tier in self.tiers:
+                tier.add(timestamp, values)
+
+    def appendSnapshot(self, snapshot, commanded: Optional[Mapping[int, int]] = None) -> None:
+        """ThermalSnapshot'ı ve komut edilen fan hızlarını (%) tüm katmanlara ekle"""
+        self.append(snapshot.timestamp, TelemetryBuffer.snapshotValues(snapshot, commanded))
+
+    def clear(self) -> None:
+        self.raw.clear()
+        with self._lock:
+            self._first = None
+            for tier in self.tiers:
+                tier.clear()
+
+    @property
+    def channels(self) -> List[str]:
+        return self.raw.channels
+
+    def latest(self, channel: str) -> Optional[float]:
+        return self.raw.latest(channel)
+
+    def _selectTier(self, seconds: float, now: float, max_points: float) -> Optional[RollupTier]:
+        # None ham tampon demektir. Geçmiş istenen süreden kısaysa, ilk okumadan
+        # bu yana tüm veriyi tutan katman da kapsıyor sayılır.
+        since = now - seconds
+        target = since if self._first is None else max(since, self._first)
+        oldest = self.raw.oldest()
+        if oldest is not None and oldest <= target and self.raw.windowCount(seconds, now) <= max_points:
+            return None
+        for tier in self.tiers:
+            oldest = tier.oldest()
+            if oldest is not None and oldest <= target and tier.windowCount(since) <= max_points:
+                return tier
+        return self.tiers[-1] if self.tiers else None
+
+    def resolutionFor(self, seconds: float, now: Optional[float] = None,
+                      max_points: Optional[int] = None) -> float:
+        """Verilen süre için kullanılacak katmanın çözünürlüğü (ham tampon için 0)"""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            tier = self._selectTier(seconds, now, max_points or self.max_points)
+            return 0.0 if tier is None else tier.resolution
+
+    def query(self, channel: str, seconds: float, now: Optional[float] = None,
+              max_points: Optional[int] = None) -> dict:
+        """Son seconds saniye için grafik noktaları.
+
+        'points' (zaman, min, max, ortalama, son) satırlarıdır; ham tampondan
+        okunduğunda dört değer de okumanın kendisidir. 'resolution' kullanılan
+        katmanın kova süresi, ham tampon için 0'dır.
+        """
+        if now is None:
+            now = time.time()
+        with self._lock:
+            tier = self._selectTier(seconds, now, max_points or self.max_points)
+            if tier is not None:
+                return {'resolution': tier.resolution, 'points': tier.points(channel, now - seconds)}
+        points = [(t, value, value, value, value) for t, value in self.raw.series(channel, seconds, now)]
+        return {'resolution': 0.0, 'points': points}
+
+    def stats(self, channel: str, seconds: Optional[float] = None, now: Optional[float] = None) -> Optional[dict]:
+        """Son seconds saniye için min, max, ortalama ve örnek sayısı; süre ham
+        tampondan uzunsa özet katmanından hesaplanır"""
+        if seconds is None:
+            return self.raw.stats(channel)
+        if now is None:
+            now = time.time()
+        with self._lock:
+            tier = self._selectTier(seconds, now, math.inf)
+            if tier is not None:
+                return tier.stats(channel, now - seconds)
+        return self.raw.stats(channel, seconds, now)
+
+    def getStats(self) -> dict:
+        """Katman başına doluluk ve toplam bellek kullanımını döndürür"""
+        stats = self.raw.getStats()
+        with self._lock:
+            stats['tiers'] = [{
+                'resolution_s': tier.resolution,
+                'buckets': len(tier),
+                'capacity': tier.capacity,
+                'memory_bytes': tier.memoryBytes
+            } for tier in self.tiers]
+            stats['memory_bytes'] += sum(tier.memoryBytes for tier in self.tiers)
+        return stats
@@ -0,0 +1,317 @@
+from typing import BinaryIO, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from datetime import datetime
+import bisect
+import glob
+import math
+import mmap
+import os
+import struct
+import threading
+
+# Dosya başlığı: sihirli değer, format sürümü, dosyanın başlangıç zamanı (f64),
+# kanal sayısı; ardından kanal adları (her biri 16 bayt)
+_MAGIC = b'AWTL'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHdH')
+_CHANNEL = struct.Struct('<16s')
+
+# Okunamayan değerler bu değerle yazılır
+MISSING = 0xFFFF
+
+_FILE_PREFIX = 'telemetry-'
+_FILE_SUFFIX = '.awtl'
+
+def _record_struct(channel_count: int) -> struct.Struct:
+    # Kayıt: başlangıçtan bu yana ms (u32) + kanal başına u16 değer
+    return struct.Struct(f'<I{channel_count}H')
+
+def default_log_dir() -> str:
+    """Günlük dosyalarının yazıldığı dizin (profiles.json ile aynı yer)"""
+    app_data = os.getenv('APPDATA', os.path.expanduser('~'))
+    return os.path.join(app_data, 'FanControl')
+
+def list_logs(directory: Optional[str] = None) -> List[str]:
+    """Dizindeki günlük dosyaları, en eskisi önce"""
+    pattern = os.path.join(directory or default_log_dir(), f'{_FILE_PREFIX}*{_FILE_SUFFIX}')
+    return sorted(glob.glob(pattern))
+
+class TelemetryLog:
+    """Okumaları sabit genişlikli ikili kayıtlar olarak diske yazar.
+
+    Bir dosyanın kanal listesi başlığında bulunur; her kayıt başlangıç
+    zamanına göre ms ve kanal başına bir u16 değerdir (sıcaklık °C, RPM, hız %).
+    Kayıtlar bellekte toplanıp flush_every kayıtta bir (varsayılan olarak bir
+    disk sayfası, 4 KB) ya da en geç flush_interval saniyede bir tek write ile
+    eklenir.
+    Dosya max_bytes'ı veya max_age'i aşınca ya da yeni bir kanal görülünce
+    yeni dosyaya geçilir. retention'dan eski dosyalar silinir.
+    """
+
+    PAGE_SIZE = 4096
+
+    def __init__(self, directory: Optional[str] = None, flush_every: Optional[int] = None,
+                 flush_interval: float = 300.0, max_bytes: int = 8 * 1024 * 1024, max_age: float = 24 * 3600,
+                 retention: float = 30 * 24 * 3600) -> None:
+        self.directory = directory or default_log_dir()
+        self._lock = threading.Lock()
+        self._flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.retention = retention
+        self._file: Optional[BinaryIO] = None
+        self._path: Optional[str] = None
+        self._channels: Tuple[str, ...] = ()
+        self._index: Dict[str, int] = {}
+        self._record: Optional[struct.Struct] = None
+        self._base = 0.0
+        self._size = 0
+        self._pending: List[bytes] = []
+        self._pending_since = 0.0
+        self.records = 0
+        self.flushes = 0
+        self.bytes_written = 0
+        self.rotations = 0
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    def _open(self, timestamp: float, channels: Sequence[str]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        name = datetime.fromtimestamp(timestamp).strftime('%Y%m%d-%H%M%S')
+        path = os.path.join(self.directory, f'{_FILE_PREFIX}{name}{_FILE_SUFFIX}')
+        suffix = 1
+        while os.path.exists(path):
+            # '_' '.' karakterinden sonra sıralanır; aynı saniyedeki dosyalar ad sırasıyla
+            # zaman sırasında kalır (list_logs buna dayanır)
+            path = os.path.join(self.directory, f'{_FILE_PREFIX}{name}_{suffix:03d}{_FILE_SUFFIX}')
+            suffix += 1
+
+        header = _HEADER.pack(_MAGIC, _VERSION, timestamp, len(channels))
+        header += b''.join(_CHANNEL.pack(channel.encode('ascii')) for channel in channels)
+        self._file = open(path, 'wb')
+        self._file.write(header)
+        self._path = path
+        self._channels = tuple(channels)
+        self._index = {channel: i for i, channel in enumerate(channels)}
+        self._record = _record_struct(len(channels))
+        self._base = timestamp
+        self._size = len(header)
+        self.bytes_written += len(header)
+
+    def _close(self) -> None:
+        if self._file is None:
+            return
+        self._flush()
+        self._file.close()
+        self._file = None
+
+    def _needsRotation(self, timestamp: float, values: Mapping[str, Optional[float]]) -> bool:
+        if self._file is None:
+            return True
+        offset = timestamp - self._base
+        if offset < 0 or offset >= self.max_age or offset * 1000 > 0xFFFFFFFF:
+            return True
+        if self._size + (len(self._pending) + 1) * self._record.size > self.max_bytes:
+            return True
+        # Yeni bir kanal (ör. taramada bulunan sensör) yeni başlık gerektirir
+        return any(channel not in self._index for channel in values)
+
+    def _rotate(self, timestamp: float, values: Mapping[str, Optional[float]]) -> None:
+        if self._file is not None:
+            self.rotations += 1
+        channels = list(self._channels)
+        channels += sorted(channel for channel in values if channel not in self._index)
+        self._close()
+        self._open(timestamp, channels)
+        self._prune(timestamp)
+
+    def _prune(self, now: float) -> None:
+        for path in list_logs(self.directory):
+            if path == self._path:
+                continue
+            try:
+                if now - os.path.getmtime(path) > self.retention:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _encode(value: Optional[float]) -> int:
+        if value is None or math.isnan(value):
+            return MISSING
+        return min(MISSING - 1, max(0, int(round(value))))
+
+    def append(self, timestamp: float, values: Mapping[str, Optional[float]]) -> None:
+        """Bir satır ekle; values'ta olmayan kanallar okunamadı olarak yazılır"""
+        with self._lock:
+            if self._needsRotation(timestamp, values):
+                self._rotate(timestamp, values)
+            fields = [MISSING] * len(self._channels)
+            for channel, value in values.items():
+                fields[self._index[channel]] = self._encode(value)
+            offset = int((timestamp - self._base) * 1000)
+            if not self._pending:
+                self._pending_since = timestamp
+            self._pending.append(self._record.pack(offset, *fields))
+            self.records += 1
+            flush_every = self._flush_every or max(1, self.PAGE_SIZE // self._record.size)
+            if len(self._pending) >= flush_every or timestamp - self._pending_since >= self.flush_interval:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending or self._file is None:
+            return
+        data = b''.join(self._pending)
+        self._file.write(data)
+        self._file.flush()
+        self._pending.clear()
+        self._size += len(data)
+        self.bytes_written += len(data)
+        self.flushes += 1
+
+    def flush(self) -> None:
+        """Bekleyen kayıtları diske yaz"""
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        """Bekleyen kayıtları yaz ve dosyayı kapat"""
+        with self._lock:
+            self._close()
+
+    def getStats(self) -> dict:
+        """Yazılan kayıt, toplu yazma ve disk kullanımı istatistiklerini döndürür"""
+        with self._lock:
+            files = list_logs(self.directory)
+            return {
+                'records': self.records,
+                'pending': len(self._pending),
+                'flushes': self.flushes,
+                'bytes_written': self.bytes_written,
+                'record_bytes': self._record.size if self._record else 0,
+                'rotations': self.rotations,
+                'files': len(files),
+                'disk_bytes': sum(os.path.getsize(path) for path in files if os.path.exists(path))
+            }
+
+class TelemetryLogFile:
+    """Bir günlük dosyasını bellek eşlemesi (mmap) ile okur.
+
+    Kayıtlar dosyadan kopyalanmadan doğrudan eşlenmiş sayfalardan çözülür.
+    Zaman aralığı sorguları ikili arama ile başlangıç kaydını bulur.
+    Uygulama çökerse yarım kalan son kayıt yok sayılır.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not a telemetry log")
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a telemetry log")
+        magic, version, base, channel_count = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a supported telemetry log")
+        self.base_time = base
+        self.channels = tuple(
+            _CHANNEL.unpack_from(self._map, _HEADER.size + i * _CHANNEL.size)[0].rstrip(b'\0').decode('ascii')
+            for i in range(channel_count)
+        )
+        self._record = _record_struct(channel_count)
+        self._start = _HEADER.size + channel_count * _CHANNEL.size
+        self._count = (len(self._map) - self._start) // self._record.size
+        self._view = memoryview(self._map)[self._start:self._start + self._count * self._record.size]
+
+    def __enter__(self) -> "TelemetryLogFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        view = getattr(self, '_view', None)
+        if view is not None:
+            view.release()
+            self._view = None
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def timestamp(self, index: int) -> float:
+        return self.base_time + self._record.unpack_from(self._view, index * self._record.size)[0] / 1000
+
+    def _indexOf(self, timestamp: float) -> int:
+        # Kayıtlar zamana göre sıralı yazıldığından ikili arama yeterli
+        return bisect.bisect_left(_TimestampView(self), timestamp)
+
+    def _unpack(self, since: Optional[float], until: Optional[float]) -> Iterator[Tuple[int, ...]]:
+        first = 0 if since is None else self._indexOf(since)
+        last = self._count if until is None else self._indexOf(until)
+        size = self._record.size
+        chunk = self._view[first * size:last * size]
+        fields = None
+        try:
+            fields = self._record.iter_unpack(chunk)
+            yield from fields
+        finally:
+            # mmap kapatılabilsin diye görünüm hemen bırakılır
+            del fields
+            chunk.release()
+
+    def records(self, since: Optional[float] = None,
+                until: Optional[float] = None) -> Iterator[Tuple[float, Tuple[Optional[int], ...]]]:
+        """[since, until) aralığındaki (zaman, kanal değerleri) kayıtları"""
+        for fields in self._unpack(since, until):
+            yield (self.base_time + fields[0] / 1000,
+                   tuple(None if value == MISSING else value for value in fields[1:]))
+
+    def series(self, channel: str, since: Optional[float] = None,
+               until: Optional[float] = None) -> List[Tuple[float, int]]:
+        """Bir kanalın [since, until) aralığındaki (zaman, değer) çiftleri"""
+        if channel not in self.channels:
+            return []
+        index = self.channels.index(channel) + 1
+        return [(self.base_time + fields[0] / 1000, fields[index])
+                for fields in self._unpack(since, until) if fields[index] != MISSING]
+
+class _TimestampView:
+    """bisect için kayıt zaman damgalarının liste görünümü"""
+
+    def __init__(self, log: TelemetryLogFile) -> None:
+        self._log = log
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def __getitem__(self, index: int) -> float:
+        return self._log.timestamp(index)
+
+def read_logs(directory: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None) -> Iterator[Tuple[float, Dict[str, Optional[int]]]]:
+    """Dizindeki tüm günlüklerden [since, until) aralığındaki kayıtları sırayla döndürür"""
+    for path in list_logs(directory):
+        try:
+            log = TelemetryLogFile(path)
+        except (OSError, ValueError):
+            continue
+        with log:
+            if until is not None and log.base_time >= until:
+                break
+            if len(log) == 0:
+                continue
+            # Son kaydı since'ten önceyse dosya tamamen eskidir
+            if since is not None and log.timestamp(len(log) - 1) < since:
+                continue
+            for timestamp, values in log.records(since, until):
+                yield timestamp, dict(zip(log.channels, values))
@@ -0,0 +1,22 @@
+from typing import Protocol, Tuple, Union, runtime_checkable
+
+@runtime_checkable
+class ThermalBackend(Protocol):
+    """AWCCWmiWrapper'ın sürdüğü donanım arayüzü.
+
+    Gerçek sistemde bu, WMI'daki AWCCWmiMethodFunction nesnesidir. Aynı iki
+    metodu sağlayan her nesne (simülasyon, kayıt/tekrar oynatma, test için sahte
+    nesne) FanControl(awcc=...) ile takılabilir; pacing, zaman aşımı, devre
+    kesici ve önbellek katmanları değişmeden çalışır.
+
+    Argüman formatı:
+        Thermal_Information: (id << 8) | işlem  (4 = sıcaklık, 5 = fan RPM)
+        Thermal_Control:     (değer << 16) | (id << 8) | işlem  (2 = fan hızı)
+    Dönüş değeri tek elemanlı tuple veya int'tir; 0xFFFFFFFF geçersiz ID demektir.
+    """
+
+    def Thermal_Information(self, arg: int) -> Union[Tuple[int], int]:
+        ...
+
+    def Thermal_Control(self, arg: int) -> Union[Tuple[int], int]:
+        ...
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+@dataclass(frozen=True)
+class ThermalSnapshot:
+    """Tek bir okuma turunda alınan tüm fan RPM ve sensör sıcaklık değerleri"""
+    timestamp: float
+    fan_rpms: Tuple[Tuple[int, Optional[int]], ...]
+    temperatures: Tuple[Tuple[int, Optional[int]], ...]
+    latencies: Tuple[Tuple[str, float], ...]
+    total_latency: float
+    stale: Tuple[str, ...] = ()
+    degraded: Tuple[str, ...] = ()
+
+    def rpm(self, fanId: int) -> Optional[int]:
+        """Belirli bir fanın bu turda okunan RPM değerini döndürür"""
+        for fan_id, rpm in self.fan_rpms:
+            if fan_id == fanId:
+                return rpm
+        return None
+
+    def temp(self, sensorId: int) -> Optional[int]:
+        """Belirli bir sensörün bu turda okunan sıcaklığını döndürür"""
+        for sensor_id, temp in self.temperatures:
+            if sensor_id == sensorId:
+                return temp
+        return None
+
+    def isStale(self, field: str) -> bool:
+        """Alan, süre aşımı nedeniyle son geçerli değerden mi geldi"""
+        return field in self.stale
+
+    def isFanDegraded(self, fanId: int) -> bool:
+        """Fan ID'si art arda hata verdiği için devre dışı mı"""
+        return f"fan_0x{fanId:02X}" in self.degraded
+
+    def isSensorDegraded(self, sensorId: int) -> bool:
+        """Sensör ID'si art arda hata verdiği için devre dışı mı"""
+        return f"sensor_0x{sensorId:02X}" in self.degraded
+
+    def latency(self, field: str) -> Optional[float]:
+        """Bir alanın okuma süresini saniye cinsinden döndürür (ör. 'fan_0x32', 'sensor_0x01')"""
+        for name, value in self.latencies:
+            if name == field:
+                return value
+        return None
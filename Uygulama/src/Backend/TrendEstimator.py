@@ -0,0 +1,34 @@
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+class TrendEstimator:
+    """Bir sensörün son okumalarından en küçük kareler ile sıcaklık eğimi (°C/s) hesaplar"""
+
+    def __init__(self, window: int = 8) -> None:
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=window)
+
+    def add(self, timestamp: float, temp: Optional[float]) -> None:
+        """Yeni okumayı halkaya ekle (okunamayan değerler atlanır)"""
+        if temp is not None:
+            self._samples.append((timestamp, float(temp)))
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+    def slope(self) -> float:
+        """Son okumalara uyan doğrunun eğimi, yeterli veri yoksa 0"""
+        count = len(self._samples)
+        if count < 3:
+            return 0.0
+        mean_t = sum(t for t, _ in self._samples) / count
+        mean_v = sum(v for _, v in self._samples) / count
+        var_t = sum((t - mean_t) ** 2 for t, _ in self._samples)
+        if var_t <= 0:
+            return 0.0
+        return sum((t - mean_t) * (v - mean_v) for t, v in self._samples) / var_t
+
+    def project(self, horizon: float) -> Optional[float]:
+        """horizon saniye sonrası için tahmini sıcaklık; yalnızca yükselişler öne alınır"""
+        if not self._samples:
+            return None
+        return self._samples[-1][1] + max(0.0, self.slope()) * horizon
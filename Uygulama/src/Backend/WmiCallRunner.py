@@ -0,0 +1,194 @@
+from typing import Callable, Optional, Tuple
+import queue
+import threading
+import time
+import logging
+
+def com_initialize() -> bool:
+    """Çağıran thread'de COM'u başlat (yalnızca Windows); başlatıldıysa True"""
+    try:
+        import pythoncom
+    except ImportError:
+        return False
+    pythoncom.CoInitialize()
+    return True
+
+def com_uninitialize() -> None:
+    """com_initialize ile başlatılan COM'u kapat"""
+    try:
+        import pythoncom
+    except ImportError:
+        return
+    pythoncom.CoUninitialize()
+
+class _CallJob:
+    __slots__ = ('method', 'arg', 'done', 'result', 'error')
+
+    def __init__(self, method: str, arg: int) -> None:
+        self.method = method
+        self.arg = arg
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+class _CallThread:
+    """AWCC nesnesini kendi içinde oluşturan ve çağrıları sırayla işleyen thread"""
+
+    def __init__(self, connect: Callable[[], object], generation: int) -> None:
+        self.jobs = queue.Queue()
+        self.ready = threading.Event()
+        self.connect_error: Optional[BaseException] = None
+        self.abandoned = False
+        self._connect = connect
+        self._thread = threading.Thread(
+            target=self._run, name=f"awcc-call-{generation}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        com_initialize()
+        try:
+            awcc = self._connect()
+        except BaseException as e:
+            self.connect_error = e
+            self.ready.set()
+            return
+        self.ready.set()
+
+        while not self.abandoned:
+            job = self.jobs.get()
+            if job is None:
+                break
+            try:
+                job.result = getattr(awcc, job.method)(job.arg)
+            except BaseException as e:
+                job.error = e
+            job.done.set()
+
+class WmiCallRunner:
+    """AWCC çağrılarını süre sınırı ile çalıştırır, takılan bağlantıyı arka planda yeniler.
+
+    Süre aşımında çağıran taraf beklemeyi bırakır; takılan thread terk edilir ve
+    watchdog yeni bir thread'de WMI bağlantısını yeniden kurar. Yeni bağlantı
+    hazır olana kadar gelen çağrılar beklemeden zaman aşımı olarak döner.
+    Watchdog aynı anda tek bir deneme thread'i tutar: firmware yanıt vermemeye
+    devam ederse yeni thread açmak yerine aynı denemeyi, aralığı her seferinde
+    ikiye katlayarak (en fazla max_reconnect_delay) bekler.
+    """
+
+    def __init__(self, connect: Callable[[], object], timeout: float = 2.0,
+                 connect_timeout: float = 30.0, reconnect_delay: float = 2.0,
+                 max_reconnect_delay: float = 60.0) -> None:
+        self._connect = connect
+        self._lock = threading.Lock()
+        self._connect_timeout = connect_timeout
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max(reconnect_delay, max_reconnect_delay)
+        self._generation = 0
+        self._reconnecting = False
+        self._closed = threading.Event()
+        self.timeout = timeout
+        self.timeouts = 0
+        self.reconnects = 0
+
+        # İlk bağlantı senkron kurulur, hata varsa çağırana iletilir
+        self._thread = self._newThread()
+        if not self._thread.ready.wait(connect_timeout):
+            self._thread.abandoned = True
+            raise TimeoutError("AWCC WMI connection timed out")
+        if self._thread.connect_error is not None:
+            raise self._thread.connect_error
+
+    @property
+    def reconnecting(self) -> bool:
+        """Watchdog bağlantıyı yeniliyor mu (çağrılar beklemeden zaman aşımı döner)"""
+        with self._lock:
+            return self._reconnecting
+
+    def _newThread(self) -> _CallThread:
+        self._generation += 1
+        return _CallThread(self._connect, self._generation)
+
+    def call(self, method: str, arg: int) -> Tuple[bool, object]:
+        """Çağrıyı çalıştır. (tamamlandı, sonuç) döner; zaman aşımında (False, None)"""
+        with self._lock:
+            thread = self._thread
+            reconnecting = self._reconnecting
+        if reconnecting or not thread.ready.is_set():
+            return False, None
+
+        job = _CallJob(method, arg)
+        thread.jobs.put(job)
+        if not job.done.wait(self.timeout):
+            self._onTimeout(thread, method, arg)
+            return False, None
+        if job.error is not None:
+            raise job.error
+        return True, job.result
+
+    def _onTimeout(self, thread: _CallThread, method: str, arg: int) -> None:
+        with self._lock:
+            self.timeouts += 1
+            if thread is not self._thread or self._reconnecting:
+                return
+            self._reconnecting = True
+        logging.warning(f"AWCC call {method}(0x{arg:X}) exceeded {self.timeout:.1f} s, recycling WMI connection")
+        thread.abandoned = True
+        thread.jobs.put(None)
+        threading.Thread(
+            target=self._watchdog, args=(method, arg), name="awcc-watchdog", daemon=True
+        ).start()
+
+    def _watchdog(self, method: str, arg: int) -> None:
+        """Takılan bağlantının yerine yenisini kurar ve takılan çağrıyla sağlığını kontrol eder"""
+        delay = self._reconnect_delay
+        new_thread: Optional[_CallThread] = None
+        probe: Optional[_CallJob] = None
+        while not self._closed.is_set():
+            if new_thread is None:
+                new_thread = self._newThread()
+                probe = None
+                wait = self._connect_timeout
+            else:
+                wait = delay
+                delay = min(delay * 2, self._max_reconnect_delay)
+
+            if not new_thread.ready.wait(wait):
+                # Bağlantı kurulumu takıldı; yeni thread açmak yerine aynısı beklenir
+                logging.warning("AWCC WMI reconnect still pending")
+                continue
+            if new_thread.connect_error is not None:
+                # Thread sonlandı; bekledikten sonra yeni bir deneme başlatılır
+                logging.warning(f"AWCC WMI reconnect failed: {new_thread.connect_error}")
+                new_thread = None
+                self._closed.wait(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+                continue
+
+            # Yeni bağlantı, takılan çağrı yanıtlanana kadar kullanılmaz
+            if probe is None:
+                probe = _CallJob(method, arg)
+                new_thread.jobs.put(probe)
+                wait = self.timeout
+            if probe.done.wait(wait):
+                with self._lock:
+                    if self._closed.is_set():
+                        break
+                    self._thread = new_thread
+                    self._reconnecting = False
+                    self.reconnects += 1
+                logging.info("AWCC WMI connection recycled")
+                return
+            logging.warning("AWCC WMI still not responding after reconnect")
+
+        if new_thread is not None:
+            new_thread.abandoned = True
+            new_thread.jobs.put(None)
+
+    def close(self) -> None:
+        """Çağrı thread'ini ve varsa watchdog denemesini durdur"""
+        with self._lock:
+            self._closed.set()
+            thread = self._thread
+        thread.abandoned = True
+        thread.jobs.put(None)
@@ -0,0 +1,45 @@
+from typing import Dict, Optional
+import threading
+
+class WriteCoalescer:
+    """Fan başına yalnızca en son istenen hızı tutan yazma birleştirici.
+
+    Slider sürüklenirken gelen ara değerler birbirinin üzerine yazılır; bir fan
+    için aynı anda en fazla bir yazma işlemi kuyrukta/işlemde bulunur.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: Dict[int, int] = {}
+        self._scheduled = set()
+        self.submitted = 0
+        self.issued = 0
+
+    def submit(self, fanId: int, speed: int) -> bool:
+        """Yeni hedef hızı kaydet. Fan için yazma planlanmamışsa True döner"""
+        with self._lock:
+            self.submitted += 1
+            self._pending[fanId] = speed
+            if fanId in self._scheduled:
+                return False
+            self._scheduled.add(fanId)
+            return True
+
+    def take(self, fanId: int) -> Optional[int]:
+        """Bekleyen en son hızı al. Bekleyen değer yoksa fanın planlamasını kaldırır"""
+        with self._lock:
+            speed = self._pending.pop(fanId, None)
+            if speed is None:
+                self._scheduled.discard(fanId)
+            else:
+                self.issued += 1
+            return speed
+
+    def getStats(self) -> dict:
+        """İstenen, gönderilen ve birleştirilerek atlanan yazma sayılarını döndürür"""
+        with self._lock:
+            return {
+                'submitted': self.submitted,
+                'issued': self.issued,
+                'saved': self.submitted - self.issued - len(self._pending)
+            }
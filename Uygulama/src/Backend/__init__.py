@@ -1,3 +1,16 @@
 from .FanControl import FanControl
+from .ThermalSnapshot import ThermalSnapshot
+from .AsyncFanControl import AsyncFanControl
+from .ThermalBackend import ThermalBackend
+from .SimulatedBackend import SimulatedThermalBackend
+from .FanCurve import FanCurve, CurveController
+from .PidController import PidController, PidGains
+from .AwccTrace import TraceRecorder, ReplayBackend, read_trace
+from .TelemetryBuffer import TelemetryBuffer
+from .TelemetryHistory import TelemetryHistory, RollupTier
+from .TelemetryLog import TelemetryLog, TelemetryLogFile, read_logs
 
-__all__ = ['FanControl'] 
\ No newline at end of file
+__all__ = ['FanControl', 'ThermalSnapshot', 'AsyncFanControl', 'ThermalBackend', 'SimulatedThermalBackend',
+           'TraceRecorder', 'ReplayBackend', 'read_trace', 'FanCurve', 'CurveController',
+           'PidController', 'PidGains', 'TelemetryBuffer',
+           'TelemetryHistory', 'RollupTier', 'TelemetryLog', 'TelemetryLogFile', 'read_logs']
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 import os
 from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtCore import Qt
@@ -6,6 +6,7 @@ from PySide6.QtGui import QAction
 from .ThermalUnitWidget import ThermalUnitWidget
 from .AppColors import Colors
 from src.Backend.FanControl import FanControl
+from src.Backend.HardwareWorker import HardwareWorker
 from src.Backend.FanProfile import FanProfile
 from .ProfileDialog import ProfileDialog
 from src.Backend.AutoStart import AutoStart
@@ -28,11 +29,12 @@ PROFILE_BALANCED = "Balanced"
 PROFILE_PERFORMANCE = "Performance"
 PROFILE_CUSTOM = "Custom"
 PROFILE_GMODE = "G Mode"  # New profile
+PROFILE_AUTO = "Auto"  # Firmware controls the fans
 
-DEFAULT_PROFILES = [PROFILE_SILENT, PROFILE_BALANCED, PROFILE_PERFORMANCE, PROFILE_GMODE]  # Add G Mode
+DEFAULT_PROFILES = [PROFILE_SILENT, PROFILE_BALANCED, PROFILE_PERFORMANCE, PROFILE_GMODE, PROFILE_AUTO]  # Add G Mode
 
 class FanControlGUI(QtWidgets.QMainWindow):
-    def __init__(self):
+    def __init__(self, fan_control_factory=FanControl):
         super().__init__()
         
         try:
@@ -54,8 +56,13 @@ class FanControlGUI(QtWidgets.QMainWindow):
             # Kaydedilen minimize to tray ayarını yükle
             self._minimize_to_tray = self._loadTraySettings()
             
-            # Fan kontrolünü başlat
-            self._fanControl = FanControl()
+            # Fan kontrolünü donanım thread'inde başlat. Geçmiş ayarları worker
+            # başlamadan okunur; günlük kapalıysa hiç açılmaz
+            telemetry_capacity, telemetry_log = self._loadTelemetrySettings()
+            self._hardware = HardwareWorker(fan_control_factory, telemetry_capacity=telemetry_capacity,
+                                            telemetry_log=telemetry_log)
+            self._hardware.start()
+            self._fanControl = self._hardware.fanControl
             
             # Create Translator
             self.translator = Translator()
@@ -66,6 +73,18 @@ class FanControlGUI(QtWidgets.QMainWindow):
         except Exception as e:
             raise Exception(f"GUI başlatılamadı: {str(e)}")
 
+    def showEvent(self, event):
+        """Pencere görünür olduğunda normal okuma aralığına dön"""
+        super().showEvent(event)
+        if hasattr(self, '_hardware'):
+            self._hardware.setBackground(False)
+
+    def hideEvent(self, event):
+        """Pencere gizlendiğinde, sıcaklık kontrolü yoksa okumaları seyrelt"""
+        super().hideEvent(event)
+        if hasattr(self, '_hardware'):
+            self._hardware.setBackground(True)
+
     def closeEvent(self, event):
         """Pencere kapatıldığında"""
         try:
@@ -114,11 +133,19 @@ class FanControlGUI(QtWidgets.QMainWindow):
             # Backend and flags
             self._ignoreSliderChanges = False
             self._suppressNotification = False
+            self._lastSnapshot = None
+            
+            # Custom profile is saved once the slider settles, not on every step
+            self._profileSaveTimer = QtCore.QTimer(self)
+            self._profileSaveTimer.setSingleShot(True)
+            self._profileSaveTimer.setInterval(500)
+            self._profileSaveTimer.timeout.connect(self._fanControl.profile_manager._save_profiles)
             self._autostart = AutoStart("Fan Control Center")
             self._hotkey_manager = HotkeyManager()
             self._hotkey_manager.initialize_default_hotkeys()
             self._global_hotkey = GlobalHotkey()
-            self._global_hotkey.start()
+            # Kısayol callback'leri widget'lara dokunur, GUI thread'inde çalıştırılmalı
+            self._global_hotkey.start(process_in_thread=False)
             
             # Create system tray icon
             self._createTrayIcon()
@@ -322,11 +349,15 @@ class FanControlGUI(QtWidgets.QMainWindow):
             # Add top bar to content layout
             self.content_layout.addWidget(top_bar)
             
-            # Timer
-            self._updateTimer = QtCore.QTimer(self)
-            self._updateTimer.timeout.connect(self._updateStats)
-            # Set default interval value
-            self._updateTimer.setInterval(1000)  # Default value is 1 second
+            # Hardware worker publishes snapshots to the GUI thread
+            self._hardware.snapshotReady.connect(self._updateStats)
+            self._hardware.commandFinished.connect(self._onHardwareCommandFinished)
+            self._hardware.deviceDiscovered.connect(self._onDeviceDiscovered)
+            
+            # Kısayol kuyruğu, izleme aralığından bağımsız kısa bir timer ile boşaltılır
+            self._hotkeyTimer = QtCore.QTimer(self)
+            self._hotkeyTimer.setInterval(50)
+            self._hotkeyTimer.timeout.connect(self._processHotkeyQueue)
             
             # Create pages and menu buttons
             self.create_pages()
@@ -339,9 +370,12 @@ class FanControlGUI(QtWidgets.QMainWindow):
             # Load settings
             self._loadSettings()
             
-            # Start update timer
+            # Set fan callbacks and start hotkey timer
             self._startUpdateTimer()
             
+            # Scan remaining fan/sensor IDs in the background once the UI is up
+            QtCore.QTimer.singleShot(5000, self._hardware.startDiscovery)
+            
             # Sidebar settings
             self.sidebar_visible = False
             self.sidebar.setMinimumWidth(0)
@@ -361,7 +395,7 @@ class FanControlGUI(QtWidgets.QMainWindow):
             if last_profile and last_profile in self._fanControl.profile_manager.profiles:
                 self._suppressNotification = True  # Suppress notification
                 self._profileCombo.setCurrentText(last_profile)
-                self._fanControl.apply_profile(last_profile)
+                self._hardware.applyProfile(last_profile)
                 self._suppressNotification = False
 
         except Exception as e:
@@ -385,6 +419,7 @@ class FanControlGUI(QtWidgets.QMainWindow):
             'Balanced': self.translator.get_text('profile_balanced'),
             'Performance': self.translator.get_text('profile_performance'),
             'G Mode': self.translator.get_text('profile_gmode'),
+            'Auto': self.translator.get_text('profile_auto'),
             'Custom': self.translator.get_text('profile_custom')
         }
         
@@ -423,6 +458,7 @@ class FanControlGUI(QtWidgets.QMainWindow):
             'Balanced': self.translator.get_text('profile_balanced'),
             'Performance': self.translator.get_text('profile_performance'),
             'G Mode': self.translator.get_text('profile_gmode'),
+            'Auto': self.translator.get_text('profile_auto'),
             'Custom': self.translator.get_text('profile_custom')
         }
         
@@ -525,10 +561,12 @@ class FanControlGUI(QtWidgets.QMainWindow):
         spinbox_layout.setContentsMargins(0, 0, 0, 0)
         spinbox_layout.setSpacing(5)
         
-        self.interval_spinbox = QtWidgets.QSpinBox()
-        self.interval_spinbox.setMinimum(1)
+        self.interval_spinbox = QtWidgets.QDoubleSpinBox()
+        self.interval_spinbox.setDecimals(2)
+        self.interval_spinbox.setSingleStep(0.25)
+        self.interval_spinbox.setMinimum(0.25)
         self.interval_spinbox.setMaximum(60)
-        self.interval_spinbox.setValue(int(self._updateTimer.interval() / 1000))
+        self.interval_spinbox.setValue(self._hardware.interval)
         self.interval_spinbox.valueChanged.connect(self._onIntervalChanged)
         self.interval_spinbox.setFixedWidth(70)
         
@@ -579,6 +617,7 @@ class FanControlGUI(QtWidgets.QMainWindow):
                 'Balanced': self.translator.get_text('profile_balanced'),
                 'Performance': self.translator.get_text('profile_performance'),
                 'G Mode': self.translator.get_text('profile_gmode'),
+                'Auto': self.translator.get_text('profile_auto'),
                 'Custom': self.translator.get_text('profile_custom')
             }
             # Add translated name but keep original name as userData
@@ -721,7 +760,8 @@ class FanControlGUI(QtWidgets.QMainWindow):
             'Balanced': self.translator.get_text('profile_balanced'),
             'Performance': self.translator.get_text('profile_performance'),
             'Custom': self.translator.get_text('profile_custom'),
-            'G Mode': self.translator.get_text('profile_gmode')
+            'G Mode': self.translator.get_text('profile_gmode'),
+            'Auto': self.translator.get_text('profile_auto')
         }
         
         # Profilleri ekle
@@ -760,21 +800,21 @@ class FanControlGUI(QtWidgets.QMainWindow):
         # Ayarları kaydet
         try:
             if hasattr(self, '_fanControl'):
-                settings_path = os.path.join(
-                    os.getenv('APPDATA', os.path.expanduser('~')),
-                    'FanControl',
-                    'settings.json'
-                )
-                
-                os.makedirs(os.path.dirname(settings_path), exist_ok=True)
-                
-                settings = {
-                    'minimize_to_tray': self._minimize_to_tray,
-                    'last_profile': self._fanControl.profile_manager.current_profile if hasattr(self._fanControl, 'profile_manager') else None
-                }
-                
-                with open(settings_path, 'w') as f:
-                    json.dump(settings, f, indent=2)
+                # Tüm ayarlar yazılır; yalnızca birkaç anahtar yazmak diğerlerini silerdi
+                self._saveSettings()
+            
+            # Bekleyen Custom profil kaydını tamamla
+            if hasattr(self, '_profileSaveTimer') and self._profileSaveTimer.isActive():
+                self._profileSaveTimer.stop()
+                self._fanControl.profile_manager._save_profiles()
+            
+            # Donanım thread'ini durdur
+            if hasattr(self, '_hardware'):
+                self._hardware.stop()
+                logging.info(f"Hardware command queue stats: {self._hardware.getSchedulerStats()}")
+                logging.info(f"Fan control writes per minute: {self._fanControl.getControlStats()}")
+                logging.info(f"Polling stats: {self._hardware.getPollingStats()}")
+                logging.info(f"Telemetry: {self._hardware.telemetry.getStats()}")
             
             # Hotkey'leri temizle
             if hasattr(self, '_hotkey_manager'):
@@ -787,30 +827,65 @@ class FanControlGUI(QtWidgets.QMainWindow):
             # Hata olursa yine de kapat
             QtWidgets.QApplication.quit() 
 
-    @QtCore.Slot()
-    def _updateStats(self) -> None:
-        """Update fan RPM and temperature values"""
+    @QtCore.Slot(object)
+    def _updateStats(self, snapshot) -> None:
+        """Update fan RPM and temperature values from the hardware worker snapshot"""
         try:
-            # Update RPM values
-            rpms = self._fanControl.getAllFanRPM()
-            if len(rpms) >= 2:
-                self._cpuFan.updateRPM(rpms[0])
-                self._gpuFan.updateRPM(rpms[1])
-            
-            # Update temperature values
-            cpu_temp = self._fanControl.getSensorTemp(self._fanControl.CPU_SENSOR_ID)
-            gpu_temp = self._fanControl.getSensorTemp(self._fanControl.GPU_SENSOR_ID)
-            
-            self._cpuFan.updateTemp(cpu_temp)
-            self._gpuFan.updateTemp(gpu_temp)
-            
-            # Update system tray tooltip
-            tooltip = f"CPU: {cpu_temp if cpu_temp else 'N/A'}°C ({rpms[0] if rpms[0] else '0'} RPM)\n"
-            tooltip += f"GPU: {gpu_temp if gpu_temp else 'N/A'}°C ({rpms[1] if rpms[1] else '0'} RPM)"
-            self.trayIcon.setToolTip(tooltip)
+            self._lastSnapshot = snapshot
+            self._applySnapshot(snapshot)
         except Exception as e:
             print(f"Update error: {e}")
 
+    def _applySnapshot(self, snapshot) -> None:
+        """Update gauges and tray tooltip from a thermal snapshot"""
+        cpu_rpm = snapshot.rpm(self._fanControl.CPU_FAN_ID)
+        gpu_rpm = snapshot.rpm(self._fanControl.GPU_FAN_ID)
+        cpu_temp = snapshot.temp(self._fanControl.CPU_SENSOR_ID)
+        gpu_temp = snapshot.temp(self._fanControl.GPU_SENSOR_ID)
+        
+        cpu_rpm_degraded = snapshot.isFanDegraded(self._fanControl.CPU_FAN_ID)
+        gpu_rpm_degraded = snapshot.isFanDegraded(self._fanControl.GPU_FAN_ID)
+        
+        # Update RPM values
+        self._cpuFan.updateRPM(cpu_rpm, cpu_rpm_degraded)
+        self._gpuFan.updateRPM(gpu_rpm, gpu_rpm_degraded)
+        
+        # Update temperature values
+        self._cpuFan.updateTemp(cpu_temp, snapshot.isSensorDegraded(self._fanControl.CPU_SENSOR_ID))
+        self._gpuFan.updateTemp(gpu_temp, snapshot.isSensorDegraded(self._fanControl.GPU_SENSOR_ID))
+        
+        # Update system tray tooltip
+        degraded_text = self.translator.get_text('degraded')
+        cpu_rpm_text = degraded_text if cpu_rpm_degraded else f"{cpu_rpm if cpu_rpm else '0'} RPM"
+        gpu_rpm_text = degraded_text if gpu_rpm_degraded else f"{gpu_rpm if gpu_rpm else '0'} RPM"
+        tooltip = f"CPU: {cpu_temp if cpu_temp else 'N/A'}°C ({cpu_rpm_text})\n"
+        tooltip += f"GPU: {gpu_temp if gpu_temp else 'N/A'}°C ({gpu_rpm_text})"
+        
+        # Sensors and fans found by background discovery
+        for sensor_id in self._fanControl.discovered_sensors:
+            temp = snapshot.temp(sensor_id)
+            if temp is not None:
+                tooltip += f"\nSensor 0x{sensor_id:02X}: {temp}°C"
+        for fan_id in self._fanControl.discovered_fans:
+            rpm = snapshot.rpm(fan_id)
+            tooltip += f"\nFan 0x{fan_id:02X}: {rpm if rpm else '0'} RPM"
+        self.trayIcon.setToolTip(tooltip)
+
+    @QtCore.Slot(str, int)
+    def _onDeviceDiscovered(self, kind: str, item_id: int) -> None:
+        """Called when background discovery confirms a new fan or sensor"""
+        logging.info(f"New {kind} available: 0x{item_id:02X}")
+
+    @QtCore.Slot(str, bool)
+    def _onHardwareCommandFinished(self, name: str, success: bool) -> None:
+        """Called on the GUI thread when a queued hardware command completes"""
+        if name == 'apply_profile' and not success:
+            QtWidgets.QMessageBox.warning(
+                self,
+                self.translator.get_text('error'),
+                self.translator.get_text('failed_apply')
+            )
+
     def _onProfileChanged(self, profile_name: str) -> None:
         """Called when profile changes"""
         try:
@@ -820,12 +895,15 @@ class FanControlGUI(QtWidgets.QMainWindow):
                 self.translator.get_text('profile_balanced'): 'Balanced',
                 self.translator.get_text('profile_performance'): 'Performance',
                 self.translator.get_text('profile_gmode'): 'G Mode',
+                self.translator.get_text('profile_auto'): 'Auto',
                 self.translator.get_text('profile_custom'): 'Custom'
             }
             original_name = profile_translations.get(profile_name, profile_name)
             
-            # Apply profile
-            if self._fanControl.apply_profile(original_name):
+            # Apply profile on the hardware worker, failures are reported back
+            if self._fanControl.profile_manager.get_profile(original_name):
+                self._hardware.applyProfile(original_name)
+                
                 # Update existing profile
                 self._fanControl.profile_manager.current_profile = original_name
                 self._fanControl.profile_manager._save_profiles()
@@ -975,6 +1053,7 @@ class FanControlGUI(QtWidgets.QMainWindow):
                 'Balanced': self.translator.get_text('profile_balanced'),
                 'Performance': self.translator.get_text('profile_performance'),
                 'G Mode': self.translator.get_text('profile_gmode'),
+                'Auto': self.translator.get_text('profile_auto'),
                 'Custom': self.translator.get_text('profile_custom')
             }
             
@@ -993,34 +1072,34 @@ class FanControlGUI(QtWidgets.QMainWindow):
         if hasattr(self, '_ignoreSliderChanges') and self._ignoreSliderChanges:
             return
         
-        # Set fan speed
-        if self._fanControl.setFanSpeed(fanId, speed):
-            # Get existing speeds
-            cpu_speed = self._cpuFan._speedSlider.value()
-            gpu_speed = self._gpuFan._speedSlider.value()
-            
-            # Update custom profile or create
-            custom_profile = FanProfile(PROFILE_CUSTOM, cpu_speed, gpu_speed)
-            self._fanControl.profile_manager.profiles[PROFILE_CUSTOM] = custom_profile
-            
-            # Add "Custom" profile to ComboBox if not exists
-            if self._profileCombo.findText(PROFILE_CUSTOM) == -1:
-                self._profileCombo.addItem(PROFILE_CUSTOM)
-            
-            # Temporarily disable notification
-            self._suppressNotification = True
-            
-            # Switch ComboBox to "Custom" profile
-            if self._profileCombo.currentText() != PROFILE_CUSTOM:
-                self._profileCombo.setCurrentText(PROFILE_CUSTOM)
-            else:
-                # If profile is already "Custom", call manual update method
-                self._fanControl.profile_manager.current_profile = PROFILE_CUSTOM
-                self._fanControl.profile_manager._save_profiles()
-                self._updateWindowTitle()
-            
-            # Re-enable notification
-            self._suppressNotification = False 
+        # Queue fan speed write on the hardware worker, only the latest value per fan is written
+        self._hardware.setFanSpeed(fanId, speed)
+        # Get existing speeds
+        cpu_speed = self._cpuFan._speedSlider.value()
+        gpu_speed = self._gpuFan._speedSlider.value()
+        
+        # Update custom profile or create
+        custom_profile = FanProfile(PROFILE_CUSTOM, cpu_speed, gpu_speed)
+        self._fanControl.profile_manager.profiles[PROFILE_CUSTOM] = custom_profile
+        
+        # Add "Custom" profile to ComboBox if not exists
+        if self._profileCombo.findText(PROFILE_CUSTOM) == -1:
+            self._profileCombo.addItem(PROFILE_CUSTOM)
+        
+        # Temporarily disable notification
+        self._suppressNotification = True
+        
+        # Switch ComboBox to "Custom" profile
+        if self._profileCombo.currentText() != PROFILE_CUSTOM:
+            self._profileCombo.setCurrentText(PROFILE_CUSTOM)
+        else:
+            # If profile is already "Custom", call manual update method
+            self._fanControl.profile_manager.current_profile = PROFILE_CUSTOM
+            self._profileSaveTimer.start()
+            self._updateWindowTitle()
+        
+        # Re-enable notification
+        self._suppressNotification = False 
 
     def _startUpdateTimer(self):
         """Start timer and set fan callbacks"""
@@ -1032,20 +1111,17 @@ class FanControlGUI(QtWidgets.QMainWindow):
             lambda speed: self._onManualSpeedChange(self._fanControl.GPU_FAN_ID, speed)
         )
         
-        # Start timer (interval will be set after settings load)
-        self._updateTimer.start()
-        
-        # Check hotkey queue
-        def check_hotkey_queue():
-            try:
-                while not self._global_hotkey.message_queue.empty():
-                    callback = self._global_hotkey.message_queue.get_nowait()
-                    callback()
-            except:
-                pass
-        
-        # Add hotkey control to timer
-        self._updateTimer.timeout.connect(check_hotkey_queue)
+        # Start hotkey timer
+        self._hotkeyTimer.start()
+
+    def _processHotkeyQueue(self) -> None:
+        """Run hotkey callbacks queued by the keyboard hook on the GUI thread"""
+        try:
+            while not self._global_hotkey.message_queue.empty():
+                callback = self._global_hotkey.message_queue.get_nowait()
+                callback()
+        except:
+            pass
 
     def _updateProfileInfo(self, profile_name: str) -> None:
         """Update profile information"""
@@ -1082,6 +1158,7 @@ class FanControlGUI(QtWidgets.QMainWindow):
             'Balanced': self.translator.get_text('profile_balanced'),
             'Performance': self.translator.get_text('profile_performance'),
             'G Mode': self.translator.get_text('profile_gmode'),
+            'Auto': self.translator.get_text('profile_auto'),
             'Custom': self.translator.get_text('profile_custom')
         }
         
@@ -1130,13 +1207,10 @@ class FanControlGUI(QtWidgets.QMainWindow):
             # Update hotkey label
             self.current_hotkey_label.setText(dialog.key_sequence)
 
-    def _onIntervalChanged(self, value: int):
+    def _onIntervalChanged(self, value: float):
         """Update performance monitoring interval"""
-        # Convert to milliseconds
-        interval_ms = value * 1000
-        
-        # Update timer
-        self._updateTimer.setInterval(interval_ms)
+        # Update hardware polling interval
+        self._hardware.setInterval(value)
         
         # Save setting
         self._saveSettings()
@@ -1144,11 +1218,27 @@ class FanControlGUI(QtWidgets.QMainWindow):
     def _saveSettings(self):
         """Save settings"""
         try:
+            control_stats = self._fanControl.getControlStats()
+            polling_stats = self._hardware.getPollingStats()
             settings = {
                 'monitoring_interval': self.interval_spinbox.value(),
+                'temp_interval_ms': int(self._hardware.interval * 1000),
+                'rpm_interval_ms': int(self._hardware.rpmInterval * 1000),
                 'language': self.translator.current_language,
                 'last_profile': self._fanControl.profile_manager.current_profile,
-                'minimize_to_tray': self._minimize_to_tray
+                'minimize_to_tray': self._minimize_to_tray,
+                'wmi_min_delay_ms': int(self._fanControl.getCallPacingStats()['min_delay_ms']),
+                'wmi_call_timeout_ms': int(self._fanControl.getWatchdogStats()['timeout_ms']),
+                'control_hysteresis_c': control_stats['temp_hysteresis'],
+                'control_min_step': control_stats['min_step'],
+                'control_min_hold_ms': int(control_stats['min_hold_ms']),
+                'control_predict_horizon_s': self._fanControl.predict_horizon,
+                'control_load_feedforward': self._fanControl.load_feedforward,
+                'adaptive_polling': polling_stats['adaptive'],
+                'poll_min_interval_ms': int(polling_stats['min_interval_ms']),
+                'poll_max_interval_ms': int(polling_stats['max_interval_ms']),
+                'telemetry_capacity': self._hardware.telemetry.capacity,
+                'telemetry_log': self._hardware.telemetryLogging
             }
             
             # Save settings as JSON
@@ -1180,10 +1270,42 @@ class FanControlGUI(QtWidgets.QMainWindow):
                     settings = json.load(f)
                     
                 # Load monitoring interval setting
-                if 'monitoring_interval' in settings:
-                    interval = max(1, int(settings['monitoring_interval']))  # Minimum 1 second
+                # Sıcaklık aralığı; eski ayar dosyalarında yalnızca monitoring_interval bulunur
+                interval = None
+                if 'temp_interval_ms' in settings:
+                    interval = settings['temp_interval_ms'] / 1000
+                elif 'monitoring_interval' in settings:
+                    interval = float(settings['monitoring_interval'])
+                if interval is not None:
+                    interval = max(0.25, interval)  # Minimum 250 ms
                     self.interval_spinbox.setValue(interval)
-                    self._updateTimer.setInterval(interval * 1000)
+                    self._hardware.setInterval(interval)
+                if 'rpm_interval_ms' in settings:
+                    self._hardware.setRpmInterval(settings['rpm_interval_ms'] / 1000)
+                    
+                # Load WMI call pacing setting
+                if 'wmi_min_delay_ms' in settings:
+                    self._fanControl.setMinCallDelay(int(settings['wmi_min_delay_ms']))
+                if 'wmi_call_timeout_ms' in settings:
+                    self._fanControl.setCallTimeout(int(settings['wmi_call_timeout_ms']))
+                
+                # Load fan control hysteresis settings
+                self._fanControl.setControlDeadband(
+                    temp_hysteresis=settings.get('control_hysteresis_c'),
+                    min_step=settings.get('control_min_step'),
+                    min_hold_ms=settings.get('control_min_hold_ms')
+                )
+                if 'control_predict_horizon_s' in settings:
+                    self._fanControl.setPredictHorizon(float(settings['control_predict_horizon_s']))
+                if 'control_load_feedforward' in settings:
+                    self._fanControl.setLoadFeedforward(int(settings['control_load_feedforward']))
+                
+                # Load adaptive polling settings
+                self._hardware.setAdaptivePolling(
+                    bool(settings.get('adaptive_polling', True)),
+                    settings['poll_min_interval_ms'] / 1000 if 'poll_min_interval_ms' in settings else None,
+                    settings['poll_max_interval_ms'] / 1000 if 'poll_max_interval_ms' in settings else None
+                )
                     
                 # Load language setting
                 if 'language' in settings:
@@ -1252,6 +1374,8 @@ class FanControlGUI(QtWidgets.QMainWindow):
             # Fan widgets
             self._cpuFan.setTitle(self.translator.get_text('cpu_fan'))
             self._gpuFan.setTitle(self.translator.get_text('gpu_fan'))
+            self._cpuFan.setDegradedText(self.translator.get_text('degraded'))
+            self._gpuFan.setDegradedText(self.translator.get_text('degraded'))
             
             # Menu buttons (with emojis)
             self.dashboard_btn.setText("📊 " + self.translator.get_text('dashboard'))
@@ -1328,7 +1452,8 @@ class FanControlGUI(QtWidgets.QMainWindow):
             'Balanced': self.translator.get_text('profile_balanced'),
             'Performance': self.translator.get_text('profile_performance'),
             'Custom': self.translator.get_text('profile_custom'),
-            'G Mode': self.translator.get_text('profile_gmode')
+            'G Mode': self.translator.get_text('profile_gmode'),
+            'Auto': self.translator.get_text('profile_auto')
         }
         
         # Reverse translation dictionary
@@ -1430,6 +1555,23 @@ class FanControlGUI(QtWidgets.QMainWindow):
             pass
         return True  # Dosya/ayar yoksa varsayılan olarak aktif
 
+    def _loadTelemetrySettings(self) -> Tuple[int, bool]:
+        """Load telemetry history size and disk logging settings"""
+        try:
+            settings_path = os.path.join(
+                os.getenv('APPDATA', os.path.expanduser('~')),
+                'FanControl',
+                'settings.json'
+            )
+            
+            if os.path.exists(settings_path):
+                with open(settings_path, 'r') as f:
+                    settings = json.load(f)
+                    return int(settings.get('telemetry_capacity', 3600)), bool(settings.get('telemetry_log', True))
+        except:
+            pass
+        return 3600, True
+
     def _toggleTrayMinimize(self, checked: bool) -> None:
         """Change system tray setting"""
         try:
@@ -1467,8 +1609,10 @@ class FanControlGUI(QtWidgets.QMainWindow):
             # Get profile name
             profile_name = self._profileCombo.itemData(index)  # Get original name from userData
             
-            # Apply profile
-            if self._fanControl.apply_profile(profile_name):
+            # Apply profile on the hardware worker
+            if self._fanControl.profile_manager.get_profile(profile_name):
+                self._hardware.applyProfile(profile_name)
+                
                 # Save last profile
                 self._hotkey_manager.set_last_profile(profile_name)
                 
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from PySide6 import QtWidgets
 from src.Backend.FanProfile import FanProfile
 
@@ -6,6 +7,7 @@ class ProfileDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.setWindowTitle("Profil Ayarları")
         self.setModal(True)
+        self._profile = profile
         
         layout = QtWidgets.QFormLayout(self)
         
@@ -40,6 +42,14 @@ class ProfileDialog(QtWidgets.QDialog):
         layout.addRow(buttonBox)
         
     def getProfile(self) -> FanProfile:
+        if self._profile is not None:
+            # Düzenlenen profilin eğri, hedef sıcaklık ve PID alanları korunur
+            return replace(
+                self._profile,
+                name=self.nameEdit.text(),
+                cpu_speed=self.cpuSpeedSpin.value(),
+                gpu_speed=self.gpuSpeedSpin.value()
+            )
         return FanProfile(
             name=self.nameEdit.text(),
             cpu_speed=self.cpuSpeedSpin.value(),
@@ -44,22 +44,36 @@ class ThermalUnitWidget(QtWidgets.QGroupBox):
         # Callback fonksiyonları
         self._speedChangeCallback: Optional[Callable[[int], None]] = None
         
+        # Art arda okunamayan fan/sensör için gösterilen metin (dile göre ayarlanır)
+        self._degradedText = "Degraded"
+        
     def setSpeedChangeCallback(self, callback: Callable[[int], None]) -> None:
         """Fan hızı değiştiğinde çağrılacak fonksiyonu ayarla"""
         self._speedChangeCallback = callback
         
-    def updateRPM(self, rpm: Optional[int]) -> None:
+    def setDegradedText(self, text: str) -> None:
+        """Okunamayan fan/sensör için gösterilecek metni ayarla"""
+        self._degradedText = text
+        
+    def updateRPM(self, rpm: Optional[int], degraded: bool = False) -> None:
         """RPM değerini güncelle"""
-        if rpm is None:
+        if degraded:
+            # Fan ID'si art arda okunamadı, 0 RPM yerine bozuk olarak göster
+            self._rpmGauge.setValue(0)
+            self._rpmGauge.setFormat(self._degradedText)
+        elif rpm is None:
             self._rpmGauge.setValue(0)
             self._rpmGauge.setFormat("0 RPM")  # N/A yerine 0 RPM göster
         else:
             self._rpmGauge.setValue(min(5000, rpm))  # 5000 RPM maksimum
             self._rpmGauge.setFormat(f"{rpm} RPM")
             
-    def updateTemp(self, temp: Optional[int]) -> None:
+    def updateTemp(self, temp: Optional[int], degraded: bool = False) -> None:
         """Sıcaklık değerini güncelle"""
-        if temp is None:
+        if degraded:
+            self._tempGauge.setValue(0)
+            self._tempGauge.setFormat(self._degradedText)
+        elif temp is None:
             self._tempGauge.setValue(0)
             self._tempGauge.setFormat("N/A")
         else:
@@ -41,6 +41,8 @@ TRANSLATIONS = {
         'not_set': 'Not Set',
         'please_select': 'Please select...',
         'profile_gmode': 'G Mode',
+        'profile_auto': 'Auto (Firmware)',
+        'degraded': 'Degraded',
         'minimize_to_tray': 'Minimize to System Tray',
         'show': 'Show',
         'exit': 'Exit',
@@ -92,6 +94,8 @@ TRANSLATIONS = {
         'not_set': 'Ayarlanmadı',
         'please_select': 'Lütfen seçiniz...',
         'profile_gmode': 'G Mode',
+        'profile_auto': 'Otomatik (Firmware)',
+        'degraded': 'Arızalı',
         'minimize_to_tray': 'Sistem Tepsisine Küçült',
         'show': 'Göster',
         'exit': 'Çıkış',
@@ -143,6 +147,8 @@ TRANSLATIONS = {
         'not_set': 'No Establecido',
         'please_select': 'Por favor seleccione...',
         'profile_gmode': 'Modo G',
+        'profile_auto': 'Automático (Firmware)',
+        'degraded': 'Degradado',
         'minimize_to_tray': 'Minimizar a la Bandeja del Sistema',
         'show': 'Mostrar',
         'exit': 'Salir',
@@ -189,6 +195,8 @@ TRANSLATIONS = {
         'not_set': 'Non Défini',
         'please_select': 'Veuillez sélectionner...',
         'profile_gmode': 'Mode G',
+        'profile_auto': 'Auto (Firmware)',
+        'degraded': 'Dégradé',
         'minimize_to_tray': 'Réduire dans la Zone de Notification',
         'show': 'Afficher',
         'exit': 'Quitter',
@@ -235,6 +243,8 @@ TRANSLATIONS = {
         'not_set': 'Não Definido',
         'please_select': 'Por favor selecione...',
         'profile_gmode': 'Modo G',
+        'profile_auto': 'Automático (Firmware)',
+        'degraded': 'Degradado',
         'minimize_to_tray': 'Minimizar para a Bandeja do Sistema',
         'show': 'Mostrar',
         'exit': 'Sair',
@@ -281,6 +291,8 @@ TRANSLATIONS = {
         'not_set': 'غير محدد',
         'please_select': '...الرجاء الاختيار',
         'profile_gmode': 'وضع G',
+        'profile_auto': 'تلقائي (البرنامج الثابت)',
+        'degraded': 'متدهور',
         'minimize_to_tray': 'تصغير إلى شريط النظام',
         'show': 'عرض',
         'exit': 'خروج',
@@ -327,6 +339,8 @@ TRANSLATIONS = {
         'not_set': '未设置',
         'please_select': '请选择...',
         'profile_gmode': 'G模式',
+        'profile_auto': '自动（固件）',
+        'degraded': '已降级',
         'minimize_to_tray': '最小化到系统托盘',
         'show': '显示',
         'exit': '退出',
@@ -373,6 +387,8 @@ TRANSLATIONS = {
         'not_set': 'Не задано',
         'please_select': 'Пожалуйста, выберите...',
         'profile_gmode': 'G режим',
+        'profile_auto': 'Авто (прошивка)',
+        'degraded': 'Неисправен',
         'minimize_to_tray': 'Свернуть в Системный Трей',
         'show': 'Показать',
         'exit': 'Выход',